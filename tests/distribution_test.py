@@ -7,27 +7,58 @@
 
 import os
 import sys
+import re
 import json
 import time
+import hashlib
 import random
 import asyncio
 import argparse
-from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from datetime import datetime, date, timedelta
+from typing import Dict, List, Any, Optional, Tuple, Callable, NamedTuple
+from functools import partial, lru_cache
 from dataclasses import dataclass, field
 from pathlib import Path
 from io import BytesIO
+import zipfile
 import requests
 import aiohttp
 from faker import Faker
 
+# 可选的文件生成库，缺失时退化为只写文件头
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+try:
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
+    REPORTLAB_AVAILABLE = True
+except ImportError:
+    REPORTLAB_AVAILABLE = False
+
+try:
+    from openpyxl import Workbook
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+try:
+    from docx import Document
+    DOCX_AVAILABLE = True
+except ImportError:
+    DOCX_AVAILABLE = False
+
 # 初始化 Faker
 fake = Faker('zh_CN')
 
 # 导入工具类模块
 from utils.test_base import TestConfig, TestResult, TestCase, MockDatabase, BATCH_CONFIGS
-from utils.http_client import HttpClient, AsyncHttpClient
+from utils.http_client import HttpClient, AsyncHttpClient, preserialize_json, PreSerializedJson
 from utils.report_generator import ReportGenerator
+from utils.random_utils import RandomUtils
 
 
 # ==================== 数据生成模块 ====================
@@ -35,15 +66,35 @@ from utils.report_generator import ReportGenerator
 class DataGenerator:
     """测试数据生成器"""
 
+    # 数字字段的取值范围
+    NUMBER_POPULATION = range(1, 101)
+
+    # 文本字段名关键字（按优先级排列，分组序号对应 TEXT_FIELD_GENERATORS 的下标）
+    TEXT_FIELD_PATTERN = re.compile(
+        r'^(?:.*?(姓名|name)|.*?(地址|address)|.*?(邮箱|email)|.*?(电话|phone)|.*?(部门|department))',
+        re.IGNORECASE | re.DOTALL
+    )
+    TEXT_FIELD_GENERATORS = (fake.name, fake.address, fake.email, fake.phone_number, fake.company)
+
     def __init__(self, schema: Dict):
         self.schema = schema
         self.columns = schema.get('columns', [])
 
-    def generate_field_value(self, field_def: Dict) -> Any:
-        """根据字段定义生成测试数据"""
-        field_name = field_def.get('name', '')
+        # 预先解析字段名及每个字段的生成函数，避免每行重复分派（三者下标一一对应）
+        self._field_names: Tuple[str, ...] = tuple(column.get('name', '') for column in self.columns)
+        self._field_generators: Tuple[Callable[[], Any], ...] = tuple(
+            self._build_field_generator(column) for column in self.columns
+        )
+
+        # 按列批量生成时使用的生成函数
+        self._column_generators: Tuple[Callable[[int], List[Any]], ...] = tuple(
+            self._build_column_generator(column, generator)
+            for column, generator in zip(self.columns, self._field_generators)
+        )
+
+    def _build_field_generator(self, field_def: Dict) -> Callable[[], Any]:
+        """根据字段定义解析出无参生成函数"""
         field_type = field_def.get('type', 'Text')
-        is_required = field_def.get('required', False)
 
         # 类型映射
         type_mapping = {
@@ -57,48 +108,78 @@ class DataGenerator:
             '双选框(是/否)': self._generate_boolean_text
         }
 
-        generator = type_mapping.get(field_type, self._generate_text)
-        value = generator(field_def)
+        generator = type_mapping.get(field_type, self._generate_text)(field_def)
 
         # 确保必填字段不为空
-        if is_required and not value:
-            value = self._generate_default_value(field_type)
+        if field_def.get('required', False):
+            default_value = self._generate_default_value(field_type)
+            base_generator = generator
 
-        return value
+            def generator() -> Any:
+                return base_generator() or default_value
 
-    def _generate_text(self, field_def: Dict) -> str:
-        """生成文本值"""
-        field_name = field_def.get('name', '')
+        return generator
+
+    def _build_column_generator(self, field_def: Dict, field_generator: Callable[[], Any]) -> Callable[[int], List[Any]]:
+        """根据字段定义解析出按列批量生成函数"""
+        field_type = field_def.get('type', 'Text')
+
+        # 数字、日期、布尔类型从候选值中一次性抽样整列
+        recent_dates = self._recent_dates()
+        population_mapping = {
+            '数字': self.NUMBER_POPULATION,
+            'Number': self.NUMBER_POPULATION,
+            '日期': recent_dates,
+            'Date': recent_dates,
+            '布尔值': (True, False),
+            'Boolean': (True, False),
+            '双选框(是/否)': ('true', 'false')
+        }
+
+        population = population_mapping.get(field_type)
+        if population is None:
+            # 文本类型逐个调用已解析的生成函数
+            return lambda count: [field_generator() for _ in range(count)]
 
+        if field_def.get('required', False):
+            default_value = self._generate_default_value(field_type)
+            population = tuple(value or default_value for value in population)
+
+        return lambda count: RandomUtils.choices(population, count)
+
+    @staticmethod
+    def _recent_dates() -> Tuple[str, ...]:
+        """最近 30 天（含今天）的日期字符串"""
+        today = date.today()
+        return tuple((today - timedelta(days=offset)).strftime('%Y-%m-%d') for offset in range(31))
+
+    def generate_field_value(self, field_def: Dict) -> Any:
+        """根据字段定义生成测试数据"""
+        return self._build_field_generator(field_def)()
+
+    def _generate_text(self, field_def: Dict) -> Callable[[], str]:
+        """生成文本值"""
         # 根据字段名智能生成
-        if '姓名' in field_name or 'name' in field_name.lower():
-            return fake.name()
-        elif '地址' in field_name or 'address' in field_name.lower():
-            return fake.address()
-        elif '邮箱' in field_name or 'email' in field_name.lower():
-            return fake.email()
-        elif '电话' in field_name or 'phone' in field_name.lower():
-            return fake.phone_number()
-        elif '部门' in field_name or 'department' in field_name.lower():
-            return fake.company()
-        else:
-            return fake.sentence()
+        match = self.TEXT_FIELD_PATTERN.match(field_def.get('name', ''))
+        if match:
+            return self.TEXT_FIELD_GENERATORS[match.lastindex - 1]
+        return fake.sentence
 
-    def _generate_number(self, field_def: Dict) -> int:
+    def _generate_number(self, field_def: Dict) -> Callable[[], int]:
         """生成数字值"""
-        return random.randint(1, 100)
+        return partial(random.randint, 1, 100)
 
-    def _generate_date(self, field_def: Dict) -> str:
+    def _generate_date(self, field_def: Dict) -> Callable[[], str]:
         """生成日期值"""
-        return fake.date_between(start_date='-30d', end_date='today').strftime('%Y-%m-%d')
+        return lambda: fake.date_between(start_date='-30d', end_date='today').strftime('%Y-%m-%d')
 
-    def _generate_boolean(self, field_def: Dict) -> bool:
+    def _generate_boolean(self, field_def: Dict) -> Callable[[], bool]:
         """生成布尔值"""
-        return random.choice([True, False])
+        return partial(random.choice, (True, False))
 
-    def _generate_boolean_text(self, field_def: Dict) -> str:
+    def _generate_boolean_text(self, field_def: Dict) -> Callable[[], str]:
         """生成双选框文本值（是/否）"""
-        return random.choice(['true', 'false'])
+        return partial(random.choice, ('true', 'false'))
 
     def _generate_default_value(self, field_type: str) -> Any:
         """生成默认值"""
@@ -115,16 +196,20 @@ class DataGenerator:
 
     def generate_test_data(self) -> Dict:
         """生成完整的测试数据"""
-        data = {}
-        for column in self.columns:
-            field_name = column.get('name', '')
-            value = self.generate_field_value(column)
-            data[field_name] = value
-        return data
+        return {field_name: generator() for field_name, generator in zip(self._field_names, self._field_generators)}
+
+    def generate_columns(self, count: int) -> Dict[str, List[Any]]:
+        """按列生成多组测试数据"""
+        return {field_name: generator(count) for field_name, generator in zip(self._field_names, self._column_generators)}
 
     def generate_multiple_test_data(self, count: int) -> List[Dict]:
         """生成多组测试数据"""
-        return [self.generate_test_data() for _ in range(count)]
+        columns = self.generate_columns(count)
+        if not columns:
+            return [{} for _ in range(count)]
+
+        field_names = list(columns)
+        return [dict(zip(field_names, row)) for row in zip(*columns.values())]
 
 
 class TestFileGenerator:
@@ -132,167 +217,162 @@ class TestFileGenerator:
 
     SUPPORTED_TYPES = ['pdf', 'docx', 'xlsx', 'txt', 'png', 'jpg', 'zip']
 
+    # 缓存文件内容时的大小分桶粒度（字节）
+    SIZE_BUCKET = 4 * 1024
+
+    # 文本文件的重复单元（预先编码）
+    TXT_UNIT = '测试文本 '.encode('utf-8')
+
+    # generate_all 生成的样例文件大小范围（字节）及缓存清单
+    SAMPLE_SIZE_RANGE = (10 * 1024, 100 * 1024)
+    MANIFEST_NAME = '.manifest.json'
+    MANIFEST_VERSION = 1
+
     @staticmethod
     def generate_txt(path: str, size: int = 1024) -> bytes:
         """生成文本文件"""
-        content = '测试文本 ' * (size // 10 + 1)
-        content = content.encode('utf-8')
-        return content[:size]
+        unit = TestFileGenerator.TXT_UNIT
+        return (unit * (size // len(unit) + 1))[:size]
 
     @staticmethod
     def generate_png(path: str, size: int = 1024) -> bytes:
         """生成 PNG 图片文件"""
-        try:
-            from PIL import Image
-            import io
+        if not PIL_AVAILABLE:
+            # 如果 Pillow 不可用，生成简单的 PNG 文件头
+            png_header = b'\x89PNG\r\n\x1a\n'
+            return png_header.ljust(size, b'\x00')
 
-            # 计算图片尺寸（保持合理的宽高比）
-            img_size = int((size * 8) ** 0.5)
-            img_size = max(img_size, 100)  # 最小 100x100
+        # 计算图片尺寸（保持合理的宽高比）
+        img_size = int((size * 8) ** 0.5)
+        img_size = max(img_size, 100)  # 最小 100x100
 
-            # 创建简单的图片
-            img = Image.new('RGB', (img_size, img_size), color=(random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)))
+        # 创建简单的图片
+        img = Image.new('RGB', (img_size, img_size), color=(random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)))
 
-            # 保存到字节流
-            buffer = io.BytesIO()
+        # 保存到字节流
+        buffer = BytesIO()
+        img.save(buffer, format='PNG')
+        content = buffer.getvalue()
+
+        # 如果生成的文件太大，创建更小的图片
+        if len(content) > size:
+            img_size = int((size * 8) ** 0.5) // 2
+            img = Image.new('RGB', (img_size, img_size), color=(random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)))
+            buffer = BytesIO()
             img.save(buffer, format='PNG')
             content = buffer.getvalue()
 
-            # 如果生成的文件太大，创建更小的图片
-            if len(content) > size:
-                img_size = int((size * 8) ** 0.5) // 2
-                img = Image.new('RGB', (img_size, img_size), color=(random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)))
-                buffer = io.BytesIO()
-                img.save(buffer, format='PNG')
-                content = buffer.getvalue()
-
-            return content
-        except ImportError:
-            # 如果 Pillow 不可用，生成简单的 PNG 文件头
-            png_header = b'\x89PNG\r\n\x1a\n'
-            return png_header + b'\x00' * (size - len(png_header))
+        return content
 
     @staticmethod
     def generate_pdf(path: str, size: int = 1024) -> bytes:
         """生成 PDF 文件"""
-        try:
-            from reportlab.pdfgen import canvas
-            from reportlab.lib.pagesizes import letter
-            import io
+        if not REPORTLAB_AVAILABLE:
+            # 如果 reportlab 不可用，生成简单的 PDF 文件头
+            pdf_header = b'%PDF-1.4\n'
+            return pdf_header.ljust(size, b'\x00')
 
-            buffer = io.BytesIO()
-            c = canvas.Canvas(buffer, pagesize=letter)
+        buffer = BytesIO()
+        c = canvas.Canvas(buffer, pagesize=letter)
 
-            # 添加一些文本
-            c.drawString(100, 750, "测试 PDF 文件")
-            c.drawString(100, 730, f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            c.drawString(100, 710, f"测试内容: {'测试 ' * 100}")
+        # 添加一些文本
+        c.drawString(100, 750, "测试 PDF 文件")
+        c.drawString(100, 730, f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        c.drawString(100, 710, f"测试内容: {'测试 ' * 100}")
+
+        c.save()
+        content = buffer.getvalue()
 
+        # 如果生成的文件太大，调整内容
+        if len(content) > size:
+            buffer = BytesIO()
+            c = canvas.Canvas(buffer, pagesize=letter)
+            c.drawString(100, 750, "测试 PDF 文件")
             c.save()
             content = buffer.getvalue()
 
-            # 如果生成的文件太大，调整内容
-            if len(content) > size:
-                buffer = io.BytesIO()
-                c = canvas.Canvas(buffer, pagesize=letter)
-                c.drawString(100, 750, "测试 PDF 文件")
-                c.save()
-                content = buffer.getvalue()
-
-            return content
-        except ImportError:
-            # 如果 reportlab 不可用，生成简单的 PDF 文件头
-            pdf_header = b'%PDF-1.4\n'
-            return pdf_header + b'\x00' * (size - len(pdf_header))
+        return content
 
     @staticmethod
     def generate_xlsx(path: str, size: int = 1024) -> bytes:
         """生成 Excel 文件"""
-        try:
-            from openpyxl import Workbook
-            from openpyxl.writer.excel import save_virtual_workbook
+        if not OPENPYXL_AVAILABLE:
+            # 如果 openpyxl 不可用，生成简单的 XLSX 文件头
+            xlsx_header = b'PK\x03\x04'
+            return xlsx_header.ljust(size, b'\x00')
 
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "测试"
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "测试"
 
-            # 添加一些数据
-            ws['A1'] = "测试 Excel 文件"
-            ws['A2'] = f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        # 添加一些数据
+        ws['A1'] = "测试 Excel 文件"
+        ws['A2'] = f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
 
-            for i in range(3, 100):
-                ws[f'A{i}'] = f"测试数据 {i}"
+        for i in range(3, 100):
+            ws[f'A{i}'] = f"测试数据 {i}"
 
-            content = save_virtual_workbook(wb)
+        buffer = BytesIO()
+        wb.save(buffer)
+        content = buffer.getvalue()
 
-            # 如果生成的文件太大，减少数据
-            if len(content) > size:
-                wb = Workbook()
-                ws = wb.active
-                ws['A1'] = "测试"
-                content = save_virtual_workbook(wb)
+        # 如果生成的文件太大，减少数据
+        if len(content) > size:
+            wb = Workbook()
+            ws = wb.active
+            ws['A1'] = "测试"
+            buffer = BytesIO()
+            wb.save(buffer)
+            content = buffer.getvalue()
 
-            return content
-        except ImportError:
-            # 如果 openpyxl 不可用，生成简单的 XLSX 文件头
-            xlsx_header = b'PK\x03\x04'
-            return xlsx_header + b'\x00' * (size - len(xlsx_header))
+        return content
 
     @staticmethod
     def generate_docx(path: str, size: int = 1024) -> bytes:
         """生成 Word 文件"""
-        try:
-            from docx import Document
+        if not DOCX_AVAILABLE:
+            # 如果 python-docx 不可用，生成简单的 DOCX 文件头
+            docx_header = b'PK\x03\x04'
+            return docx_header.ljust(size, b'\x00')
 
-            doc = Document()
-            doc.add_heading('测试 Word 文件', 0)
-            doc.add_paragraph(f'生成时间: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
-            doc.add_paragraph('测试内容: ' + '测试 ' * 100)
+        doc = Document()
+        doc.add_heading('测试 Word 文件', 0)
+        doc.add_paragraph(f'生成时间: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
+        doc.add_paragraph('测试内容: ' + '测试 ' * 100)
 
+        buffer = BytesIO()
+        doc.save(buffer)
+        content = buffer.getvalue()
+
+        # 如果生成的文件太大，减少内容
+        if len(content) > size:
+            doc = Document()
+            doc.add_paragraph('测试')
             buffer = BytesIO()
             doc.save(buffer)
             content = buffer.getvalue()
 
-            # 如果生成的文件太大，减少内容
-            if len(content) > size:
-                doc = Document()
-                doc.add_paragraph('测试')
-                buffer = BytesIO()
-                doc.save(buffer)
-                content = buffer.getvalue()
-
-            return content
-        except ImportError:
-            # 如果 python-docx 不可用，生成简单的 DOCX 文件头
-            docx_header = b'PK\x03\x04'
-            return docx_header + b'\x00' * (size - len(docx_header))
+        return content
 
     @staticmethod
     def generate_zip(path: str, size: int = 1024) -> bytes:
         """生成 ZIP 文件"""
-        try:
-            import zipfile
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+            # 添加一些文件
+            zf.writestr('test.txt', '测试内容 ' * 100)
 
+        content = buffer.getvalue()
+
+        # 如果生成的文件太大，减少内容
+        if len(content) > size:
             buffer = BytesIO()
             with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-                # 添加一些文件
-                zf.writestr('test.txt', '测试内容 ' * 100)
+                zf.writestr('test.txt', '测试')
 
             content = buffer.getvalue()
 
-            # 如果生成的文件太大，减少内容
-            if len(content) > size:
-                buffer = BytesIO()
-                with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-                    zf.writestr('test.txt', '测试')
-
-                content = buffer.getvalue()
-
-            return content
-        except ImportError:
-            # 如果 zipfile 不可用，生成简单的 ZIP 文件头
-            zip_header = b'PK\x03\x04'
-            return zip_header + b'\x00' * (size - len(zip_header))
+        return content
 
     @classmethod
     def generate_file(cls, file_type: str, size: int = 1024) -> bytes:
@@ -314,9 +394,70 @@ class TestFileGenerator:
             raise ValueError(f'不支持的文件类型: {file_type}')
 
     @classmethod
-    def generate_all(cls, output_dir: str) -> Dict[str, str]:
-        """生成所有类型的测试文件"""
+    def generate_cached_file(cls, file_type: str, size: int = 1024) -> bytes:
+        """生成指定类型的测试文件，按 4 KiB 分桶复用已生成的内容"""
+        size_bucket = max(size // cls.SIZE_BUCKET * cls.SIZE_BUCKET, cls.SIZE_BUCKET)
+        return cls._generate_cached(file_type.lower(), size_bucket)
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _generate_cached(cls, file_type: str, size_bucket: int) -> bytes:
+        """缓存的文件生成"""
+        return cls.generate_file(file_type, size_bucket)
+
+    @classmethod
+    def _manifest_key(cls) -> str:
+        """计算样例文件生成参数的哈希，参数或可用生成库变化时缓存失效"""
+        params = {
+            'version': cls.MANIFEST_VERSION,
+            'types': cls.SUPPORTED_TYPES,
+            'size_range': cls.SAMPLE_SIZE_RANGE,
+            'backends': [PIL_AVAILABLE, REPORTLAB_AVAILABLE, OPENPYXL_AVAILABLE, DOCX_AVAILABLE]
+        }
+        return hashlib.sha256(json.dumps(params, sort_keys=True).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def _load_cached_files(cls, output_dir: str, key: str) -> Optional[Dict[str, str]]:
+        """
+        读取缓存清单
+
+        Returns:
+            清单与当前参数一致且文件齐全时返回文件映射，否则返回 None
+        """
+        manifest_path = os.path.join(output_dir, cls.MANIFEST_NAME)
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        files = manifest.get('files', {}) if manifest.get('key') == key else {}
+        if set(files) != set(cls.SUPPORTED_TYPES) or not all(os.path.isfile(path) for path in files.values()):
+            return None
+        return files
+
+    @classmethod
+    def generate_all(cls, output_dir: str, force: bool = False) -> Dict[str, str]:
+        """
+        生成所有类型的测试文件
+
+        上次生成时的参数与当前一致且文件仍存在时直接复用，不再重新生成
+
+        Args:
+            output_dir: 输出目录
+            force: 忽略缓存清单，强制重新生成
+
+        Returns:
+            文件类型到文件路径的映射
+        """
         os.makedirs(output_dir, exist_ok=True)
+        key = cls._manifest_key()
+
+        if not force:
+            cached_files = cls._load_cached_files(output_dir, key)
+            if cached_files is not None:
+                return cached_files
+
         files = {}
 
         for file_type in cls.SUPPORTED_TYPES:
@@ -324,7 +465,7 @@ class TestFileGenerator:
             filepath = os.path.join(output_dir, filename)
 
             # 生成文件内容
-            content = cls.generate_file(file_type, size=random.randint(10 * 1024, 100 * 1024))
+            content = cls.generate_file(file_type, size=random.randint(*cls.SAMPLE_SIZE_RANGE))
 
             # 保存文件
             with open(filepath, 'wb') as f:
@@ -332,6 +473,10 @@ class TestFileGenerator:
 
             files[file_type] = filepath
 
+        # 写入缓存清单
+        with open(os.path.join(output_dir, cls.MANIFEST_NAME), 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'files': files}, f, ensure_ascii=False, indent=2)
+
         return files
 
 
@@ -344,7 +489,7 @@ class SchemaTest(TestCase):
         super().__init__('Schema 获取测试', '测试获取表格结构定义接口')
 
     def execute(self, client: HttpClient, config: TestConfig, db: MockDatabase) -> TestResult:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         success, data, duration = client.get_schema()
 
@@ -389,31 +534,34 @@ class AttachmentListTest(TestCase):
         super().__init__('附件列表获取测试', '测试获取任务附件列表接口')
 
     def execute(self, client: HttpClient, config: TestConfig, db: MockDatabase) -> TestResult:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         success, data, duration = client.get_attachments_list()
 
         if success:
             if 'attachments' in data:
                 attachments = data['attachments']
+                details = {'attachment_count': len(attachments)}
+
+                # 附件明细已包含在响应数据中，仅在需要时才另行整理
+                if config.keep_full_details:
+                    details['attachments'] = [
+                        {
+                            'id': att.get('id'),
+                            'file_name': att.get('fileName'),
+                            'display_name': att.get('displayName'),
+                            'file_size': att.get('fileSize')
+                        }
+                        for att in attachments
+                    ]
+
                 return TestResult(
                     test_name=self.name,
                     passed=True,
                     message=f'获取到 {len(attachments)} 个附件',
                     duration=duration,
                     response_data=data,
-                    details={
-                        'attachment_count': len(attachments),
-                        'attachments': [
-                            {
-                                'id': att.get('id'),
-                                'file_name': att.get('fileName'),
-                                'display_name': att.get('displayName'),
-                                'file_size': att.get('fileSize')
-                            }
-                            for att in attachments
-                        ]
-                    }
+                    details=details
                 )
 
         return TestResult(
@@ -433,7 +581,7 @@ class AttachmentDownloadTest(TestCase):
         super().__init__('附件下载测试', '测试下载任务附件接口')
 
     def execute(self, client: HttpClient, config: TestConfig, db: MockDatabase) -> TestResult:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # 先获取附件列表
         success, data, _ = client.get_attachments_list()
@@ -443,7 +591,7 @@ class AttachmentDownloadTest(TestCase):
                 test_name=self.name,
                 passed=False,
                 message='无法获取附件列表',
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 error=data.get('error', '未知错误')
             )
 
@@ -454,56 +602,68 @@ class AttachmentDownloadTest(TestCase):
                 test_name=self.name,
                 passed=True,
                 message='任务没有附件，跳过下载测试',
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 details={'attachment_count': 0}
             )
 
-        # 下载所有附件
-        download_results = []
-        total_duration = 0
+        # 并发下载所有附件
+        download_start = time.perf_counter()
+        download_results = config.run_async(self._download_all(config, attachments))
+        total_duration = time.perf_counter() - download_start
+
+        # 检查是否所有附件都下载成功
+        all_success = all(result['status'] == 'success' for result in download_results)
+
+        details = {
+            'total_attachments': len(attachments),
+            'successful_downloads': sum(1 for r in download_results if r['status'] == 'success'),
+            'failed_downloads': sum(1 for r in download_results if r['status'] == 'failed')
+        }
+        if config.keep_full_details:
+            details['downloads'] = download_results
+
+        return TestResult(
+            test_name=self.name,
+            passed=all_success,
+            message=f'下载了 {len(download_results)} 个附件',
+            duration=total_duration,
+            details=details
+        )
+
+    async def _download_all(self, config: TestConfig, attachments: List[Dict]) -> List[Dict]:
+        """并发下载全部附件并保存到下载目录"""
+        semaphore = asyncio.Semaphore(config.max_concurrent_downloads)
 
-        for attachment in attachments:
+        async def download(async_client: AsyncHttpClient, attachment: Dict) -> Dict:
             attachment_id = attachment.get('id')
             file_name = attachment.get('fileName', f'attachment_{attachment_id}')
 
-            success, content, duration = client.download_attachment(attachment_id)
-            total_duration += duration
+            async with semaphore:
+                success, content, duration = await async_client.download_attachment_async(attachment_id)
 
             if success and len(content) > 0:
-                # 保存下载的文件
+                # 保存下载的文件（放到线程中执行，避免阻塞事件循环）
                 save_path = os.path.join(config.downloads_dir, file_name)
-                with open(save_path, 'wb') as f:
-                    f.write(content)
+                await asyncio.to_thread(Path(save_path).write_bytes, content)
 
-                download_results.append({
+                return {
                     'id': attachment_id,
                     'file_name': file_name,
                     'size': len(content),
+                    'duration': duration,
                     'status': 'success'
-                })
-            else:
-                download_results.append({
-                    'id': attachment_id,
-                    'file_name': file_name,
-                    'size': 0,
-                    'status': 'failed'
-                })
-
-        # 检查是否所有附件都下载成功
-        all_success = all(result['status'] == 'success' for result in download_results)
+                }
 
-        return TestResult(
-            test_name=self.name,
-            passed=all_success,
-            message=f'下载了 {len(download_results)} 个附件',
-            duration=total_duration,
-            details={
-                'total_attachments': len(attachments),
-                'successful_downloads': sum(1 for r in download_results if r['status'] == 'success'),
-                'failed_downloads': sum(1 for r in download_results if r['status'] == 'failed'),
-                'downloads': download_results
+            return {
+                'id': attachment_id,
+                'file_name': file_name,
+                'size': 0,
+                'duration': duration,
+                'status': 'failed'
             }
-        )
+
+        async with AsyncHttpClient(config, limit=config.max_concurrent_downloads) as async_client:
+            return await asyncio.gather(*[download(async_client, attachment) for attachment in attachments])
 
 
 class DataGenerationTest(TestCase):
@@ -514,7 +674,7 @@ class DataGenerationTest(TestCase):
         self.schema = schema
 
     def execute(self, client: HttpClient, config: TestConfig, db: MockDatabase) -> TestResult:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             generator = DataGenerator(self.schema)
@@ -558,7 +718,7 @@ class DataGenerationTest(TestCase):
                 test_name=self.name,
                 passed=all_valid,
                 message='数据生成成功',
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 details={
                     'generated_data': test_data,
                     'validation': validation_results
@@ -569,7 +729,7 @@ class DataGenerationTest(TestCase):
                 test_name=self.name,
                 passed=False,
                 message='数据生成失败',
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 error=str(e)
             )
 
@@ -583,17 +743,17 @@ class FormSubmissionTest(TestCase):
         self.attachment_count = attachment_count
 
     def execute(self, client: HttpClient, config: TestConfig, db: MockDatabase) -> TestResult:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # 生成测试数据
-            success, schema_data, _ = client.get_schema()
+            success, schema_data = client.schema
             if not success:
                 return TestResult(
                     test_name=self.name,
                     passed=False,
                     message='无法获取 Schema',
-                    duration=time.time() - start_time,
+                    duration=time.perf_counter() - start_time,
                     error=schema_data.get('error', '未知错误')
                 )
 
@@ -615,7 +775,7 @@ class FormSubmissionTest(TestCase):
                 for i in range(self.attachment_count):
                     # 只使用任务允许的格式：.jpg, .png（不使用 jpeg，因为生成器会创建 PNG 内容）
                     file_type = random.choice(['png', 'jpg'])
-                    content = TestFileGenerator.generate_file(file_type, size=random.randint(10 * 1024, 50 * 1024))
+                    content = TestFileGenerator.generate_cached_file(file_type, size=random.randint(10 * 1024, 50 * 1024))
                     filename = f'test_{i + 1}.{file_type}'
                     files.append(('attachment', filename, content))
 
@@ -664,7 +824,7 @@ class FormSubmissionTest(TestCase):
                 test_name=self.name,
                 passed=False,
                 message='表单提交失败',
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 error=str(e)
             )
 
@@ -672,6 +832,10 @@ class FormSubmissionTest(TestCase):
 class BatchSubmissionTest(TestCase):
     """批量提交测试"""
 
+    # 随机提交人的联系方式范围（11 位数字）及部门
+    CONTACT_POPULATION = range(10000000000, 100000000000)
+    DEPARTMENTS = ('技术部', '人事部', '财务部', '市场部')
+
     def __init__(self, count: int, concurrent: int = 1):
         super().__init__(
             f'批量提交测试 ({count}次提交, {concurrent}并发)',
@@ -681,160 +845,110 @@ class BatchSubmissionTest(TestCase):
         self.concurrent = concurrent
 
     def execute(self, client: HttpClient, config: TestConfig, db: MockDatabase) -> TestResult:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            # 获取 Schema
-            success, schema_data, _ = client.get_schema()
+            # 获取 Schema（整个测试运行期间复用缓存）
+            success, schema_data = client.schema
             if not success:
                 return TestResult(
                     test_name=self.name,
                     passed=False,
                     message='无法获取 Schema',
-                    duration=time.time() - start_time,
+                    duration=time.perf_counter() - start_time,
                     error=schema_data.get('error', '未知错误')
                 )
 
             generator = DataGenerator(schema_data)
 
-            if self.concurrent > 1:
-                # 并发测试
-                loop = asyncio.get_event_loop()
-                result = loop.run_until_complete(self._run_concurrent_test(config, generator, db))
-                return result
-            else:
-                # 单线程测试
-                return self._run_sequential_test(client, config, generator, db)
+            # 并发数为 1 时同样走异步路径，由信号量限制并发并复用连接
+            return config.run_async(self._run_concurrent_test(config, generator, db))
 
         except Exception as e:
             return TestResult(
                 test_name=self.name,
                 passed=False,
                 message='批量提交测试失败',
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 error=str(e)
             )
 
-    def _run_sequential_test(self, client: HttpClient, config: TestConfig, generator: DataGenerator, db: MockDatabase) -> TestResult:
-        """运行单线程批量测试"""
-        start_time = time.time()
-        results = []
-
-        for i in range(self.count):
-            # 生成测试数据
-            form_data = generator.generate_test_data()
-
-            # 准备提交数据
-            submit_data = {
-                'name': f'测试用户{i + 1}',
-                'contact': str(random.randint(10000000000, 99999999999)),
-                'department': random.choice(['技术部', '人事部', '财务部', '市场部']),
-                'jsonData': form_data
-            }
-
-            # 提交表单
-            success, response_data, duration = client.submit_form(submit_data)
-
-            results.append({
-                'index': i + 1,
-                'name': submit_data['name'],
-                'success': success,
-                'duration': duration,
-                'error': response_data.get('error') if not success else None
-            })
-
-            # 保存到模拟数据库
-            if success:
-                db.insert('test_submissions', {
-                    'name': submit_data['name'],
-                    'contact': submit_data['contact'],
-                    'department': submit_data['department'],
-                    'data': form_data,
-                    'attachment_count': 0,
-                    'status': 'success',
-                    'response': response_data
-                })
-
-        total_duration = time.time() - start_time
-        success_count = sum(1 for r in results if r['success'])
-
-        return TestResult(
-            test_name=self.name,
-            passed=success_count > 0,
-            message=f'成功提交 {success_count}/{self.count} 次',
-            duration=total_duration,
-            details={
-                'total_submissions': self.count,
-                'successful_submissions': success_count,
-                'failed_submissions': self.count - success_count,
-                'average_duration': sum(r['duration'] for r in results) / len(results) if results else 0,
-                'max_duration': max(r['duration'] for r in results) if results else 0,
-                'min_duration': min(r['duration'] for r in results) if results else 0,
-                'results': results[:10]  # 只保留前10条详细结果
-            }
-        )
-
     async def _run_concurrent_test(self, config: TestConfig, generator: DataGenerator, db: MockDatabase) -> TestResult:
         """运行并发批量测试"""
-        start_time = time.time()
-
-        # 创建异步客户端
-        async_client = AsyncHttpClient(config)
-
-        # 创建异步任务
-        tasks = []
-        for i in range(self.count):
-            # 生成测试数据
-            form_data = generator.generate_test_data()
-
-            # 准备提交数据
-            submit_data = {
-                'name': f'测试用户{i + 1}',
-                'contact': str(random.randint(10000000000, 99999999999)),
-                'department': random.choice(['技术部', '人事部', '财务部', '市场部']),
-                'jsonData': form_data
+        start_time = time.perf_counter()
+
+        # 一次性按列生成全部测试数据及提交人信息
+        form_data_list = generator.generate_multiple_test_data(self.count)
+        names = [f'测试用户{i + 1}' for i in range(self.count)]
+        contacts = [str(contact) for contact in RandomUtils.choices(self.CONTACT_POPULATION, self.count)]
+        departments = RandomUtils.choices(self.DEPARTMENTS, self.count)
+
+        payloads = [
+            {
+                'name': names[i],
+                'contact': contacts[i],
+                'department': departments[i],
+                'jsonData': form_data_list[i]
             }
+            for i in range(self.count)
+        ]
 
-            task = async_client.submit_form_async(submit_data)
-            tasks.append((i + 1, submit_data['name'], task))
-
-        # 执行并发任务
+        # 并发上限与连接池大小一致，结果按提交顺序存放响应或异常（退出时关闭会话）
         results = []
-        completed_tasks = await asyncio.gather(*[task for _, _, task in tasks], return_exceptions=True)
+        async with AsyncHttpClient(config, limit=self.concurrent) as async_client:
+            completed_tasks = await async_client.submit_many(payloads, concurrency=self.concurrent)
 
-        for (index, name, _), result in zip(tasks, completed_tasks):
+        # 单次遍历完成结果整理与统计
+        pending_rows = []
+        success_count = 0
+        duration_sum = 0.0
+        max_duration = float('-inf')
+        min_duration = float('inf')
+
+        for i, result in enumerate(completed_tasks):
             if isinstance(result, Exception):
-                results.append({
-                    'index': index,
-                    'name': name,
+                entry = {
+                    'index': i + 1,
+                    'name': names[i],
                     'success': False,
                     'duration': 0,
-                    'error': str(result)
-                })
+                    # 保存异常对象本身，仅在写入报告时才格式化为字符串
+                    'error': result
+                }
             else:
                 success, response_data, duration = result
-                results.append({
-                    'index': index,
-                    'name': name,
+                entry = {
+                    'index': i + 1,
+                    'name': names[i],
                     'success': success,
                     'duration': duration,
                     'error': response_data.get('error') if not success else None
-                })
+                }
 
-                # 保存到模拟数据库
+                # 成功的提交在结束后统一写入模拟数据库
                 if success:
-                    db.insert('test_submissions', {
-                        'name': name,
-                        'contact': '',
-                        'department': '',
-                        'data': {},
+                    success_count += 1
+                    pending_rows.append({
+                        'name': names[i],
+                        'contact': contacts[i],
+                        'department': departments[i],
+                        'data': form_data_list[i],
                         'attachment_count': 0,
                         'status': 'success',
                         'response': response_data
                     })
 
-        total_duration = time.time() - start_time
-        success_count = sum(1 for r in results if r['success'])
+            results.append(entry)
+            duration = entry['duration']
+            duration_sum += duration
+            if duration > max_duration:
+                max_duration = duration
+            if duration < min_duration:
+                min_duration = duration
+
+        db.insert_many('test_submissions', pending_rows)
+
+        total_duration = time.perf_counter() - start_time
 
         return TestResult(
             test_name=self.name,
@@ -846,110 +960,83 @@ class BatchSubmissionTest(TestCase):
                 'successful_submissions': success_count,
                 'failed_submissions': self.count - success_count,
                 'concurrent': self.concurrent,
-                'average_duration': sum(r['duration'] for r in results) / len(results) if results else 0,
-                'max_duration': max(r['duration'] for r in results) if results else 0,
-                'min_duration': min(r['duration'] for r in results) if results else 0,
+                'average_duration': duration_sum / len(results) if results else 0,
+                'max_duration': max_duration if results else 0,
+                'min_duration': min_duration if results else 0,
                 'results': results[:10]  # 只保留前10条详细结果
             }
         )
 
 
+# 错误场景字段取此值时使用测试配置中的默认值（None 表示不提交该字段）
+USE_DEFAULT = object()
+
+
+class ErrorScenario(NamedTuple):
+    """错误处理测试场景"""
+    name: str
+    password: Optional[str] = None
+    slug: Optional[str] = None
+    user_name: Any = USE_DEFAULT
+    contact: Any = USE_DEFAULT
+    json_data: Any = USE_DEFAULT
+    expected_status: str = 'fail'
+
+
 class ErrorHandlingTest(TestCase):
     """错误处理测试"""
 
+    # 错误测试场景
+    ERROR_SCENARIOS = (
+        ErrorScenario('无效密码', password='wrong_password'),
+        ErrorScenario('无效 Slug', slug='INVALID_SLUG'),
+        ErrorScenario('缺少姓名', user_name=None),
+        ErrorScenario('缺少联系方式', contact=None),
+        ErrorScenario('联系方式过短', contact='12'),
+        ErrorScenario('联系方式过长', contact='123456789012345'),
+        ErrorScenario('缺少表单数据', json_data=None),
+        ErrorScenario('必填字段缺失', json_data={}),
+    )
+
     def __init__(self):
         super().__init__('错误处理测试', '测试各种错误场景的处理')
 
     def execute(self, client: HttpClient, config: TestConfig, db: MockDatabase) -> TestResult:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        # 获取 Schema
-        success, schema_data, _ = client.get_schema()
+        # 获取 Schema（复用缓存）
+        success, schema_data = client.schema
         if not success:
             return TestResult(
                 test_name=self.name,
                 passed=False,
                 message='无法获取 Schema',
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 error=schema_data.get('error', '未知错误')
             )
 
         generator = DataGenerator(schema_data)
-        form_data = generator.generate_test_data()
-
-        # 错误测试场景
-        error_scenarios = [
-            {'name': '无效密码', 'password': 'wrong_password', 'expected_status': 'fail'},
-            {'name': '无效 Slug', 'slug': 'INVALID_SLUG', 'expected_status': 'fail'},
-            {'name': '缺少姓名', 'name': None, 'expected_status': 'fail'},
-            {'name': '缺少联系方式', 'contact': None, 'expected_status': 'fail'},
-            {'name': '联系方式过短', 'contact': '12', 'expected_status': 'fail'},
-            {'name': '联系方式过长', 'contact': '123456789012345', 'expected_status': 'fail'},
-            {'name': '缺少表单数据', 'jsonData': None, 'expected_status': 'fail'},
-            {'name': '必填字段缺失', 'jsonData': {}, 'expected_status': 'fail'},
-        ]
+        # 多数场景提交同一份表单数据，预先序列化一次
+        form_data = preserialize_json(generator.generate_test_data())
 
-        test_results = []
+        error_scenarios = self.ERROR_SCENARIOS
 
-        for scenario in error_scenarios:
-            try:
-                # 准备测试数据
-                submit_data = {
-                    'name': scenario.get('name', config.test_user['name']) if scenario.get('name') is not None else None,
-                    'contact': scenario.get('contact', config.test_user['contact']),
-                    'department': config.test_user['department'],
-                    'jsonData': scenario.get('jsonData', form_data)
-                }
-
-                # 使用自定义密码
-                password = scenario.get('password', config.password)
-                submit_data['password'] = password
-
-                # 使用自定义 Slug
-                slug = scenario.get('slug', config.slug)
-
-                # 临时修改配置
-                original_slug = config.slug
-                config.slug = slug
-
-                # 提交表单
-                success, response_data, duration = client.submit_form(submit_data)
-
-                # 恢复配置
-                config.slug = original_slug
-
-                # 判断测试是否通过（预期失败且实际失败）
-                expected_fail = scenario['expected_status'] == 'fail'
-                actual_fail = not success
+        # 各场景之间没有依赖，并发提交
+        test_results = config.run_async(self._run_scenarios(config, error_scenarios, form_data))
 
-                test_passed = (expected_fail and actual_fail)
-
-                test_results.append({
-                    'scenario': scenario['name'],
-                    'passed': test_passed,
-                    'expected': scenario['expected_status'],
-                    'actual': 'fail' if not success else 'success',
-                    'error': response_data.get('error') if not success else None
-                })
-
-                # 保存到模拟数据库
-                db.insert('test_errors', {
-                    'scenario': scenario['name'],
-                    'passed': test_passed,
-                    'error': response_data.get('error') if not success else None,
-                    'status': 'error_test'
-                })
-
-            except Exception as e:
-                test_results.append({
-                    'scenario': scenario['name'],
-                    'passed': False,
-                    'expected': scenario['expected_status'],
-                    'actual': 'exception',
-                    'error': str(e)
-                })
+        # 保存到模拟数据库（一次性写入）
+        db.insert_many('test_errors', [
+            {
+                'scenario': result['scenario'],
+                'passed': result['passed'],
+                'error': result['error'],
+                'status': 'error_test'
+            }
+            for result in test_results
+            if result['actual'] != 'exception'
+        ])
 
-        total_duration = time.time() - start_time
+        total_duration = time.perf_counter() - start_time
         passed_count = sum(1 for r in test_results if r['passed'])
 
         return TestResult(
@@ -965,9 +1052,63 @@ class ErrorHandlingTest(TestCase):
             }
         )
 
+    async def _run_scenarios(self, config: TestConfig, error_scenarios: Tuple[ErrorScenario, ...], form_data: PreSerializedJson) -> List[Dict]:
+        """并发执行所有错误场景"""
+        async with AsyncHttpClient(config) as async_client:
+            return await asyncio.gather(*[
+                self._run_scenario(async_client, config, scenario, form_data)
+                for scenario in error_scenarios
+            ])
+
+    async def _run_scenario(self, async_client: AsyncHttpClient, config: TestConfig, scenario: ErrorScenario, form_data: PreSerializedJson) -> Dict:
+        """执行单个错误场景（Slug 与密码通过参数传入，不修改共享配置）"""
+        try:
+            # 准备测试数据
+            submit_data = {
+                'name': config.test_user['name'] if scenario.user_name is USE_DEFAULT else scenario.user_name,
+                'contact': config.test_user['contact'] if scenario.contact is USE_DEFAULT else scenario.contact,
+                'department': config.test_user['department'],
+                'jsonData': form_data if scenario.json_data is USE_DEFAULT else scenario.json_data
+            }
+
+            # 提交表单（使用自定义 Slug 和密码）
+            success, response_data, duration = await async_client.submit_form_async(
+                submit_data,
+                slug=scenario.slug,
+                password=scenario.password
+            )
+
+            # 判断测试是否通过（预期失败且实际失败）
+            expected_fail = scenario.expected_status == 'fail'
+            actual_fail = not success
+
+            test_passed = (expected_fail and actual_fail)
+
+            return {
+                'scenario': scenario.name,
+                'passed': test_passed,
+                'expected': scenario.expected_status,
+                'actual': 'fail' if not success else 'success',
+                'error': response_data.get('error') if not success else None
+            }
+
+        except Exception as e:
+            return {
+                'scenario': scenario.name,
+                'passed': False,
+                'expected': scenario.expected_status,
+                'actual': 'exception',
+                # 保存异常对象本身，仅在写入报告时才格式化为字符串
+                'error': e
+            }
+
 
 # ==================== 测试执行引擎 ====================
 
+# 测试依赖图节点：(节点名, 测试用例工厂, 依赖的节点名)
+TestPlanNode = Tuple[str, Callable[[], Optional[TestCase]], Tuple[str, ...]]
+
+
 class TestRunner:
     """测试执行引擎"""
 
@@ -977,59 +1118,119 @@ class TestRunner:
         self.db = MockDatabase()
         self.results: List[TestResult] = []
 
-    def register_test(self, test_case: TestCase):
-        """注册测试用例"""
-        test_case.setup()
-        result = test_case.execute(self.client, self.config, self.db)
-        test_case.teardown()
-        self.results.append(result)
-        return result
+    async def _open_async_session(self):
+        """在共享事件循环内创建测试套件共享的异步会话"""
+        return AsyncHttpClient.create_session(self.config, limit=max(64, self.config.concurrent))
 
     def run_all(self) -> List[TestResult]:
-        """运行所有测试"""
-        print(f'\n开始测试...')
-        print(f'Base API: {self.config.base_api}')
-        print(f'Slug: {self.config.slug}')
-        print(f'批量提交: {self.config.batch_count} 次, {self.config.concurrent} 并发')
-        print(f'-' * 60)
+        """运行所有测试（所有异步测试共享同一事件循环和连接池）"""
+        loop = asyncio.new_event_loop()
+        self.config.event_loop = loop
+        self.config.async_session = loop.run_until_complete(self._open_async_session())
 
-        # 1. Schema 获取测试
-        result = self.register_test(SchemaTest())
-        print(f'✓ {result.test_name}: {"通过" if result.passed else "失败"} ({result.duration:.2f}s)')
+        try:
+            return self._run_all()
+        finally:
+            loop.run_until_complete(self.config.async_session.close())
+            loop.close()
+            self.config.async_session = None
+            self.config.event_loop = None
+
+    def _build_test_plan(self) -> List[TestPlanNode]:
+        """
+        构建测试依赖图
+
+        Returns:
+            按拓扑顺序排列的 (节点名, 测试用例工厂, 依赖节点) 列表；
+            工厂在依赖全部完成后才调用，返回 None 表示跳过该测试
+        """
+        def data_generation_test() -> Optional[TestCase]:
+            success, schema_data = self.client.schema
+            return DataGenerationTest(schema_data) if success else None
+
+        other_tests = ('schema', 'list', 'download', 'data', 'form_none', 'form_single', 'form_multiple', 'errors')
+
+        return [
+            ('schema', SchemaTest, ()),
+            ('list', AttachmentListTest, ()),
+            ('download', AttachmentDownloadTest, ()),
+            ('data', data_generation_test, ('schema',)),
+            ('form_none', partial(FormSubmissionTest, '表单提交测试（无附件）', '测试不带附件的表单提交', False, 0), ('schema',)),
+            ('form_single', partial(FormSubmissionTest, '表单提交测试（单个附件）', '测试带单个附件的表单提交', True, 1), ('schema',)),
+            ('form_multiple', partial(FormSubmissionTest, '表单提交测试（多个附件）', '测试带多个附件的表单提交', True, 3), ('schema',)),
+            ('errors', ErrorHandlingTest, ('schema',)),
+            # 批量提交会压满服务器，放在最后以免干扰其他测试的耗时
+            ('batch', partial(BatchSubmissionTest, self.config.batch_count, self.config.concurrent), other_tests),
+        ]
 
-        # 2. 附件列表获取测试
-        result = self.register_test(AttachmentListTest())
-        print(f'✓ {result.test_name}: {"通过" if result.passed else "失败"} ({result.duration:.2f}s)')
+    def _run_node(self, key: str, factory: Callable[[], Optional[TestCase]]) -> Optional[TestResult]:
+        """
+        在工作线程中执行单个测试节点（不输出进度，由事件循环线程统一打印）
 
-        # 3. 附件下载测试
-        result = self.register_test(AttachmentDownloadTest())
-        print(f'✓ {result.test_name}: {"通过" if result.passed else "失败"} ({result.duration:.2f}s)')
+        创建或执行测试用例时抛出的异常记为该节点失败，不影响其他节点及依赖它的节点
 
-        # 4. 数据生成测试
-        success, schema_data, _ = self.client.get_schema()
-        if success:
-            result = self.register_test(DataGenerationTest(schema_data))
-            print(f'✓ {result.test_name}: {"通过" if result.passed else "失败"} ({result.duration:.2f}s)')
+        Args:
+            key: 测试节点标识
+            factory: 创建测试用例的函数
 
-        # 5. 表单提交测试（无附件）
-        result = self.register_test(FormSubmissionTest('表单提交测试（无附件）', '测试不带附件的表单提交', False, 0))
-        print(f'✓ {result.test_name}: {"通过" if result.passed else "失败"} ({result.duration:.2f}s)')
+        Returns:
+            测试结果，节点被跳过时返回 None
+        """
+        start_time = time.perf_counter()
+        test_name = key
+        try:
+            test_case = factory()
+            if test_case is None:
+                return None
 
-        # 6. 表单提交测试（单个附件）
-        result = self.register_test(FormSubmissionTest('表单提交测试（单个附件）', '测试带单个附件的表单提交', True, 1))
-        print(f'✓ {result.test_name}: {"通过" if result.passed else "失败"} ({result.duration:.2f}s)')
+            test_name = test_case.name
+            test_case.setup()
+            try:
+                return test_case.execute(self.client, self.config, self.db)
+            finally:
+                test_case.teardown()
+        except Exception as e:
+            return TestResult(
+                test_name=test_name,
+                passed=False,
+                message=f'测试执行异常: {str(e)}',
+                duration=time.perf_counter() - start_time,
+                error=str(e)
+            )
+
+    async def _schedule(self, plan: List[TestPlanNode]) -> List[Optional[TestResult]]:
+        """
+        按依赖关系调度测试：依赖全部完成的节点立即在线程中并行执行
+
+        并行的节点共用 self.client，即在多个线程中共用同一个 requests.Session（及其连接池）；
+        各测试只发送请求、不修改会话状态（请求头、Cookie 等），连接池本身是线程安全的
+        """
+        tasks: Dict[str, asyncio.Future] = {}
 
-        # 7. 表单提交测试（多个附件）
-        result = self.register_test(FormSubmissionTest('表单提交测试（多个附件）', '测试带多个附件的表单提交', True, 3))
-        print(f'✓ {result.test_name}: {"通过" if result.passed else "失败"} ({result.duration:.2f}s)')
+        async def run_node(key: str, factory: Callable[[], Optional[TestCase]], depends_on: Tuple[str, ...]) -> Optional[TestResult]:
+            if depends_on:
+                await asyncio.gather(*(tasks[dependency] for dependency in depends_on))
+            result = await asyncio.to_thread(self._run_node, key, factory)
+            # 进度输出留在事件循环线程，避免并行节点的输出交错
+            if result is not None:
+                print(f'✓ {result.test_name}: {"通过" if result.passed else "失败"} ({result.duration:.2f}s)')
+            return result
 
-        # 8. 批量提交测试
-        result = self.register_test(BatchSubmissionTest(self.config.batch_count, self.config.concurrent))
-        print(f'✓ {result.test_name}: {"通过" if result.passed else "失败"} ({result.duration:.2f}s)')
+        for key, factory, depends_on in plan:
+            tasks[key] = asyncio.ensure_future(run_node(key, factory, depends_on))
 
-        # 9. 错误处理测试
-        result = self.register_test(ErrorHandlingTest())
-        print(f'✓ {result.test_name}: {"通过" if result.passed else "失败"} ({result.duration:.2f}s)')
+        return await asyncio.gather(*tasks.values())
+
+    def _run_all(self) -> List[TestResult]:
+        """按依赖关系执行所有测试用例，无依赖关系的测试并行执行"""
+        print(f'\n开始测试...')
+        print(f'Base API: {self.config.base_api}')
+        print(f'Slug: {self.config.slug}')
+        print(f'批量提交: {self.config.batch_count} 次, {self.config.concurrent} 并发')
+        print(f'-' * 60)
+
+        results = self.config.event_loop.run_until_complete(self._schedule(self._build_test_plan()))
+        self.results.extend(result for result in results if result is not None)
 
         print(f'-' * 60)
         print(f'测试完成!')
@@ -1053,19 +1254,14 @@ def main():
     parser.add_argument('--concurrent', type=int, help='自定义并发数')
     parser.add_argument('--output-dir', default='test_reports', help='报告输出目录')
     parser.add_argument('--no-files', action='store_true', help='不自动生成测试文件')
+    parser.add_argument('--full-details', action='store_true', help='报告中保留逐条附件明细')
 
     args = parser.parse_args()
 
-    # 确定批量配置
-    if args.count:
-        batch_count = args.count
-    else:
-        batch_count = BATCH_CONFIGS[args.batch]['count']
-
-    if args.concurrent:
-        concurrent = args.concurrent
-    else:
-        concurrent = BATCH_CONFIGS[args.batch]['concurrent']
+    # 确定批量配置（未自定义时使用预设值）
+    preset = BATCH_CONFIGS[args.batch]
+    batch_count = args.count or preset['count']
+    concurrent = args.concurrent or preset['concurrent']
 
     # 创建配置
     config = TestConfig(
@@ -1079,7 +1275,8 @@ def main():
         },
         batch_count=batch_count,
         concurrent=concurrent,
-        output_dir=args.output_dir
+        output_dir=args.output_dir,
+        keep_full_details=args.full_details
     )
 
     # 自动生成测试文件
@@ -1095,33 +1292,42 @@ def main():
     # 生成报告
     print('\n正在生成测试报告...')
 
-    # 获取 Schema 信息作为额外信息
-    success, schema_data, _ = HttpClient(config).get_schema()
+    # 获取 Schema 信息作为额外信息（复用测试过程中已缓存的结果）
+    success, schema_data = runner.client.schema
     additional_info = {'schema': schema_data if success else None}
 
     # 生成报告
     report_generator = ReportGenerator(config.output_dir)
-    report_content = report_generator.generate_markdown_report(results, config, additional_info)
 
-    # 保存报告
+    # 边生成边保存报告
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     report_filename = f'test_report_{timestamp}.md'
-    report_path = report_generator.save_report(report_content, report_filename)
+    report_path = report_generator.save_report_streaming(
+        report_filename, results, config, additional_info
+    )
 
     print(f'✓ 测试报告已保存到 {report_path}')
 
-    # 打印统计信息
+    # 报告所需数据均已获取，释放连接池
+    runner.client.close()
+
+    # 打印统计信息（只遍历一次结果）
+    total = len(results)
+    passed = sum(1 for r in results if r.passed)
+    failed = total - passed
+    rate = passed / total * 100 if total else 0.0
+
     print(f'\n{"=" * 60}')
     print(f'测试统计:')
     print(f'{"=" * 60}')
-    print(f'总测试用例: {len(results)}')
-    print(f'通过: {sum(1 for r in results if r.passed)}')
-    print(f'失败: {sum(1 for r in results if not r.passed)}')
-    print(f'通过率: {sum(1 for r in results if r.passed) / len(results) * 100:.1f}%')
+    print(f'总测试用例: {total}')
+    print(f'通过: {passed}')
+    print(f'失败: {failed}')
+    print(f'通过率: {rate:.1f}%')
     print(f'{"=" * 60}\n')
 
     # 返回退出码
-    return 0 if all(r.passed for r in results) else 1
+    return 0 if failed == 0 else 1
 
 
 if __name__ == '__main__':
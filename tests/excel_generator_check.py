@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Excel 数据生成器自检脚本
+不依赖服务器，检查各写入路径生成的工作表布局是否与表头一致，以及 Rust 写入器与 openpyxl 的输出是否一致
+"""
+
+import os
+import sys
+from io import BytesIO
+from typing import Any, Callable, List, Tuple
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl import Workbook, load_workbook
+
+from utils.excel_generator import ExcelDataGenerator, FAST_EXCEL_AVAILABLE
+
+
+# 含重复表头的模板：重复的列各自占一列，后续列不能错位
+DUPLICATE_HEADERS = ['姓名', '备注', '姓名', '电话']
+
+ROW_COUNT = 5
+
+# 后端一致性检查用的表头与记录：字段顺序不同、缺少字段、带多余字段
+PARITY_HEADERS = ['姓名', '年龄', '备注']
+PARITY_ROWS = [
+    {'年龄': 3, '姓名': '张'},
+    {'姓名': '李', '年龄': 4, '备注': 'x', '多余': 1},
+]
+
+
+def build_template(headers: List[str]) -> bytes:
+    """
+    生成只有表头行的模板文件
+
+    Args:
+        headers: 表头列表
+
+    Returns:
+        模板文件的字节内容
+    """
+    wb = Workbook()
+    ws = wb.active
+    ws.append(headers)
+    buffer = BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+def read_sheet_rows(content: bytes) -> List[Tuple[Any, ...]]:
+    """
+    读取 Excel 文件第一个工作表的全部行（空单元格统一为空字符串）
+
+    Args:
+        content: Excel 文件的字节内容
+
+    Returns:
+        各行单元格值的元组列表
+    """
+    wb = load_workbook(BytesIO(content), read_only=True)
+    try:
+        return [
+            tuple('' if value is None else value for value in values)
+            for values in wb.worksheets[0].iter_rows(values_only=True)
+        ]
+    finally:
+        wb.close()
+
+
+def check_layout(name: str, generate: Callable[[ExcelDataGenerator], bytes]) -> bool:
+    """
+    检查重复表头模板下生成的工作表：每行单元格数与表头一致，电话列落在“电话”表头下
+
+    Args:
+        name: 写入路径名称
+        generate: 由生成器生成 Excel 文件内容的函数
+
+    Returns:
+        检查是否通过
+    """
+    generator = ExcelDataGenerator(template_content=build_template(DUPLICATE_HEADERS))
+    rows = read_sheet_rows(generate(generator))
+
+    problems = []
+    if not rows or list(rows[0]) != DUPLICATE_HEADERS:
+        problems.append(f'表头不一致: {rows[0] if rows else None}')
+    else:
+        phone_index = DUPLICATE_HEADERS.index('电话')
+        for row_number, values in enumerate(rows[1:], 2):
+            if len(values) != len(DUPLICATE_HEADERS):
+                problems.append(f'第 {row_number} 行有 {len(values)} 个单元格')
+            elif not str(values[phone_index]).isdigit():
+                problems.append(f'第 {row_number} 行电话列为 {values[phone_index]!r}')
+        if len(rows) - 1 != ROW_COUNT:
+            problems.append(f'数据行数为 {len(rows) - 1}')
+
+    if problems:
+        print(f'✗ {name}: ' + '; '.join(problems))
+        return False
+    print(f'✓ {name}')
+    return True
+
+
+def trim_row(values: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """去掉行尾的空单元格（两种写入器对空字符串单元格的处理不同）"""
+    values = list(values)
+    while values and values[-1] == '':
+        values.pop()
+    return tuple(values)
+
+
+def check_backend_parity() -> bool:
+    """
+    检查 Rust 写入器与 openpyxl 对同一批记录生成的工作表一致（未安装 Rust 写入器时跳过）
+
+    Returns:
+        检查是否通过（跳过视为通过）
+    """
+    name = 'Rust 写入器与 openpyxl 输出一致'
+    if not FAST_EXCEL_AVAILABLE:
+        print(f'- {name}: 未安装 rustpy-xlsxwriter，跳过')
+        return True
+
+    generator = ExcelDataGenerator(template_content=build_template(PARITY_HEADERS))
+    fast_rows = [trim_row(values) for values in read_sheet_rows(generator.generate_excel_file(PARITY_ROWS))]
+    openpyxl_rows = [trim_row(values) for values in read_sheet_rows(generator._generate_with_openpyxl(PARITY_ROWS))]
+    if fast_rows != openpyxl_rows:
+        print(f'✗ {name}: {fast_rows} != {openpyxl_rows}')
+        return False
+    print(f'✓ {name}')
+    return True
+
+
+def main():
+    """主程序入口"""
+    checks = [
+        ('generate_excel_file（重复表头）', lambda g: g.generate_excel_file(g.generate_rows(ROW_COUNT))),
+        ('generate_excel_file_fast（重复表头）', lambda g: g.generate_excel_file_fast(g.iter_rows(ROW_COUNT))),
+        ('generate_and_write（重复表头）', lambda g: g.generate_and_write(ROW_COUNT)),
+        ('generate_excel_file_from_columns（重复表头）', lambda g: g.generate_excel_file_from_columns(g.generate_columns(ROW_COUNT))),
+    ]
+    passed = [check_layout(name, generate) for name, generate in checks]
+    passed.append(check_backend_parity())
+    sys.exit(0 if all(passed) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -13,6 +13,8 @@ import asyncio
 import argparse
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO
 
 # 添加项目根目录到路径
@@ -24,6 +26,13 @@ from utils.excel_generator import ExcelDataGenerator
 from utils.file_utils import FileUtils
 from utils.report_generator import ReportGenerator
 
+# 可选的事件循环加速库
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 
 # ==================== 测试用例 ====================
 
@@ -34,8 +43,6 @@ class TaskInfoTest(TestCase):
         super().__init__('任务信息获取测试', '测试获取任务基本信息接口')
 
     def execute(self, client: HttpClient, config: TestConfig, db: MockDatabase) -> TestResult:
-        start_time = time.time()
-
         success, data, duration = client.get_task_info()
 
         if success:
@@ -89,8 +96,6 @@ class TemplateDownloadTest(TestCase):
         self.template_filename = None
 
     def execute(self, client: HttpClient, config: TestConfig, db: MockDatabase) -> TestResult:
-        start_time = time.time()
-
         success, content, duration = client.download_template()
 
         if success and len(content) > 0:
@@ -142,16 +147,16 @@ class TemplateDownloadTest(TestCase):
 class DataGenerationTest(TestCase):
     """数据生成测试"""
 
-    def __init__(self, template_content: bytes):
+    def __init__(self, generator: ExcelDataGenerator):
         super().__init__('数据生成测试', '测试基于模板生成模拟数据')
-        self.template_content = template_content
+        self.generator = generator
 
     def execute(self, client: HttpClient, config: TestConfig, db: MockDatabase) -> TestResult:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            # 创建 Excel 数据生成器
-            generator = ExcelDataGenerator.create_from_template_content(self.template_content)
+            # 复用测试执行引擎解析好的 Excel 数据生成器
+            generator = self.generator
 
             # 获取表头
             headers = generator.get_headers()
@@ -161,7 +166,7 @@ class DataGenerationTest(TestCase):
             test_data = generator.generate_rows(10)
 
             # 生成 Excel 文件
-            excel_content = generator.generate_excel_file(test_data, include_header=True)
+            excel_content = generator.generate_excel_file_fast(test_data)
 
             # 保存生成的文件
             filename = f'test_data_{config.slug}.xlsx'
@@ -183,7 +188,7 @@ class DataGenerationTest(TestCase):
                     test_name=self.name,
                     passed=True,
                     message=f'数据生成成功，生成 {len(test_data)} 行数据',
-                    duration=time.time() - start_time,
+                    duration=time.perf_counter() - start_time,
                     details={
                         'headers': headers,
                         'field_types': field_types,
@@ -199,7 +204,7 @@ class DataGenerationTest(TestCase):
                     test_name=self.name,
                     passed=False,
                     message=f'数据生成成功，但保存失败: {message}',
-                    duration=time.time() - start_time,
+                    duration=time.perf_counter() - start_time,
                     error=message
                 )
 
@@ -208,7 +213,7 @@ class DataGenerationTest(TestCase):
                 test_name=self.name,
                 passed=False,
                 message=f'数据生成失败: {str(e)}',
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 error=str(e)
             )
 
@@ -216,23 +221,20 @@ class DataGenerationTest(TestCase):
 class FileSubmissionTest(TestCase):
     """文件提交测试（无附件）"""
 
-    def __init__(self, name: str, description: str, template_content: bytes, row_count: int = 10):
+    def __init__(self, name: str, description: str, generator: ExcelDataGenerator, row_count: int = 10):
         super().__init__(name, description)
-        self.template_content = template_content
+        self.generator = generator
         self.row_count = row_count
 
     def execute(self, client: HttpClient, config: TestConfig, db: MockDatabase) -> TestResult:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            # 创建 Excel 数据生成器
-            generator = ExcelDataGenerator.create_from_template_content(self.template_content)
+            # 复用测试执行引擎解析好的 Excel 数据生成器
+            generator = self.generator
 
-            # 生成测试数据
-            test_data = generator.generate_rows(self.row_count)
-
-            # 生成 Excel 文件
-            excel_content = generator.generate_excel_file(test_data, include_header=True)
+            # 边生成测试数据边写入 Excel 文件，不保留全部行
+            excel_content = generator.generate_and_write(self.row_count)
 
             # 提交文件
             user = config.test_user
@@ -287,7 +289,7 @@ class FileSubmissionTest(TestCase):
                 test_name=self.name,
                 passed=False,
                 message=f'文件提交异常: {str(e)}',
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 error=str(e)
             )
 
@@ -295,58 +297,60 @@ class FileSubmissionTest(TestCase):
 class FileWithAttachmentTest(TestCase):
     """文件提交测试（带附件）"""
 
-    def __init__(self, name: str, description: str, template_content: bytes, attachment_count: int = 1):
+    # 任务信息不可用时默认允许的扩展名
+    DEFAULT_EXTENSIONS = ['.xlsx', '.xls']
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        generator: ExcelDataGenerator,
+        attachment_count: int = 1,
+        allowed_extensions: Optional[List[str]] = None
+    ):
         super().__init__(name, description)
-        self.template_content = template_content
+        self.generator = generator
         self.attachment_count = attachment_count
+        # 由测试执行引擎从已获取的任务信息传入，避免每次执行都重新请求
+        self.allowed_extensions = allowed_extensions if allowed_extensions is not None else self.DEFAULT_EXTENSIONS
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _build_excel_attachment() -> bytes:
+        """生成 Excel 附件内容（服务端不校验附件内容，只序列化一次，所有附件和测试共用）"""
+        att_generator = ExcelDataGenerator()
+        att_generator.headers = ['内容']
+        att_generator.field_types = {'内容': 'text'}
+        att_data = [{'内容': '测试附件内容'}]
+        return att_generator.generate_excel_file_fast(att_data)
 
     def execute(self, client: HttpClient, config: TestConfig, db: MockDatabase) -> TestResult:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            # 获取任务信息
-            success, task_info, _ = client.get_task_info()
-            if success:
-                allowed_extensions = task_info.get('allowedExtensions', [])
-            else:
-                allowed_extensions = ['.xlsx', '.xls']  # 默认值
+            allowed_extensions = self.allowed_extensions
 
-            # 创建 Excel 数据生成器
-            generator = ExcelDataGenerator.create_from_template_content(self.template_content)
+            # 复用测试执行引擎解析好的 Excel 数据生成器
+            generator = self.generator
 
             # 生成测试数据
             test_data = generator.generate_rows(10)
 
             # 生成 Excel 文件
-            excel_content = generator.generate_excel_file(test_data, include_header=True)
-
-            # 根据允许的扩展名生成附件
-            attachments = []
-            for i in range(self.attachment_count):
-                # 优先使用 Excel 格式
-                if '.xlsx' in allowed_extensions:
-                    att_filename = f'attachment_{i+1}.xlsx'
-                    att_generator = ExcelDataGenerator()
-                    att_generator.headers = ['内容']
-                    att_generator.field_types = {'内容': 'text'}
-                    att_data = [{'内容': f'测试附件内容 {i+1}'}]
-                    att_content = att_generator.generate_excel_file(att_data, include_header=True)
-                    attachments.append((att_filename, att_content))
-                elif '.xls' in allowed_extensions:
-                    att_filename = f'attachment_{i+1}.xls'
-                    att_generator = ExcelDataGenerator()
-                    att_generator.headers = ['内容']
-                    att_generator.field_types = {'内容': 'text'}
-                    att_data = [{'内容': f'测试附件内容 {i+1}'}]
-                    att_content = att_generator.generate_excel_file(att_data, include_header=True)
-                    attachments.append((att_filename, att_content))
-                else:
-                    # 如果没有支持的格式，使用第一个允许的格式（如果有的话）
-                    if allowed_extensions:
-                        ext = allowed_extensions[0]
-                        att_filename = f'attachment_{i+1}{ext}'
-                        att_content = f'测试附件内容 {i+1}\n' * 100
-                        attachments.append((att_filename, att_content.encode('utf-8')))
+            excel_content = generator.generate_excel_file_fast(test_data)
+
+            # 根据允许的扩展名确定附件格式，附件内容只生成一次，各附件共用
+            # 优先使用 Excel 格式
+            ext = att_content = None
+            if '.xlsx' in allowed_extensions:
+                ext, att_content = '.xlsx', self._build_excel_attachment()
+            elif '.xls' in allowed_extensions:
+                ext, att_content = '.xls', self._build_excel_attachment()
+            elif allowed_extensions:
+                # 如果没有支持的格式，使用第一个允许的格式
+                ext, att_content = allowed_extensions[0], ('测试附件内容\n' * 100).encode('utf-8')
+
+            attachments = [(f'attachment_{i+1}{ext}', att_content) for i in range(self.attachment_count)] if ext else []
 
             # 提交文件（带附件）
             user = config.test_user
@@ -401,62 +405,63 @@ class FileWithAttachmentTest(TestCase):
                 test_name=self.name,
                 passed=False,
                 message=f'文件提交异常: {str(e)}',
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 error=str(e)
             )
 
 
+# 批量/并发提交时预生成的不同 Excel 文件数量（各次提交轮询复用）
+PAYLOAD_VARIANTS = 8
+
+
+def build_excel_payload(generator: ExcelDataGenerator) -> bytes:
+    """生成一份包含 10 行测试数据的 Excel 文件内容（边生成边写入）"""
+    return generator.generate_and_write(10)
+
+
+def build_excel_payloads(generator: ExcelDataGenerator, count: int) -> List[bytes]:
+    """
+    预生成多次提交复用的 Excel 文件内容（每份 10 行测试数据）
+
+    Args:
+        generator: Excel 数据生成器
+        count: 提交次数
+
+    Returns:
+        min(count, PAYLOAD_VARIANTS) 份 Excel 文件内容，第 i 次提交使用 payloads[i % len(payloads)]
+    """
+    return [build_excel_payload(generator) for _ in range(max(1, min(count, PAYLOAD_VARIANTS)))]
+
+
 class BatchSubmissionTest(TestCase):
     """批量提交测试"""
 
-    def __init__(self, count: int, template_content: bytes):
+    # 并发上传的消费者数量上限
+    MAX_WORKERS = 8
+
+    def __init__(self, count: int, generator: ExcelDataGenerator):
         super().__init__('批量提交测试', f'测试批量提交 {count} 个文件')
         self.count = count
-        self.template_content = template_content
+        self.generator = generator
 
     def execute(self, client: HttpClient, config: TestConfig, db: MockDatabase) -> TestResult:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            # 创建 Excel 数据生成器
-            generator = ExcelDataGenerator.create_from_template_content(self.template_content)
-
-            success_count = 0
-            failed_count = 0
-            results = []
-
-            for i in range(self.count):
-                # 生成测试数据
-                test_data = generator.generate_rows(10)
-
-                # 生成 Excel 文件
-                excel_content = generator.generate_excel_file(test_data, include_header=True)
-
-                # 提交文件
-                user = config.test_user
-                success, response_data, _ = client.submit_file(
-                    name=f'{user["name"]}_{i+1}',
-                    contact=str(int(user["contact"]) + i),
-                    department=user['department'],
-                    file_content=excel_content,
-                    file_name=f'{user["name"]}_{i+1}.xlsx',
-                    password=config.password
-                )
+            # 复用测试执行引擎解析好的 Excel 数据生成器
+            generator = self.generator
 
-                if success:
-                    success_count += 1
-                    results.append({
-                        'index': i+1,
-                        'status': 'success',
-                        'filename': response_data.get('filename', '')
-                    })
-                else:
-                    failed_count += 1
-                    results.append({
-                        'index': i+1,
-                        'status': 'failed',
-                        'error': response_data.get('error', '未知错误')
-                    })
+            # 生成与上传流水线执行，结果按列存放（成功标记、文件名、错误信息）
+            success_mask, filenames, errors = config.run_async(self._run_pipeline(config, generator))
+            success_count = sum(success_mask)
+            failed_count = self.count - success_count
+
+            # 只为报告中展示的前 10 个结果构造字典
+            results = [
+                {'index': i+1, 'status': 'success', 'filename': filenames[i]} if success_mask[i]
+                else {'index': i+1, 'status': 'failed', 'error': errors[i]}
+                for i in range(min(10, self.count))
+            ]
 
             # 保存到数据库
             db.insert('test_submissions', {
@@ -470,13 +475,13 @@ class BatchSubmissionTest(TestCase):
                 test_name=self.name,
                 passed=success_count > 0,
                 message=f'批量提交完成: {success_count}/{self.count} 成功',
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 details={
                     'total_count': self.count,
                     'success_count': success_count,
                     'failed_count': failed_count,
                     'success_rate': f'{success_count / self.count * 100:.1f}%',
-                    'results': results[:10]  # 只显示前10个结果
+                    'results': results  # 只显示前10个结果
                 }
             )
 
@@ -485,75 +490,162 @@ class BatchSubmissionTest(TestCase):
                 test_name=self.name,
                 passed=False,
                 message=f'批量提交异常: {str(e)}',
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 error=str(e)
             )
 
+    async def _run_pipeline(
+        self,
+        config: TestConfig,
+        generator: ExcelDataGenerator
+    ) -> Tuple[bytearray, List[Optional[str]], List[Optional[str]]]:
+        """
+        生产者在线程中生成 Excel 内容并放入有界队列，多个消费者并发上传，
+        使文件生成与已生成文件的上传相互重叠
+
+        Returns:
+            按提交序号排列的 (成功标记, 文件名, 错误信息)
+        """
+        # 提交人信息只解析一次，各次提交在此基础上按序号递增
+        user = config.test_user
+        base_name = user['name']
+        base_contact = int(user['contact'])
+        department = user['department']
+
+        workers = max(1, min(self.count, config.concurrent, self.MAX_WORKERS))
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2 * workers)
+        success_mask = bytearray(self.count)
+        filenames: List[Optional[str]] = [None] * self.count
+        errors: List[Optional[str]] = [None] * self.count
+
+        async def produce():
+            """生成前 PAYLOAD_VARIANTS 份内容，之后轮询复用，各次提交只改变提交人信息和文件名"""
+            payloads = []
+            try:
+                for i in range(self.count):
+                    if i < PAYLOAD_VARIANTS:
+                        payloads.append(await asyncio.to_thread(build_excel_payload, generator))
+                    await queue.put((i, payloads[i % len(payloads)]))
+            finally:
+                # 无论生成是否出错，都通知所有消费者结束
+                for _ in range(workers):
+                    await queue.put(None)
+
+        async def consume(async_client: AsyncHttpClient):
+            """从队列取出文件并上传，直到收到结束标记"""
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+
+                i, excel_content = item
+                submitter = f'{base_name}_{i+1}'
+                success, response_data, _ = await async_client.submit_file_async(
+                    name=submitter,
+                    contact=str(base_contact + i),
+                    department=department,
+                    file_content=excel_content,
+                    file_name=f'{submitter}.xlsx',
+                    password=config.password
+                )
+
+                if success:
+                    success_mask[i] = 1
+                    filenames[i] = response_data.get('filename', '')
+                else:
+                    errors[i] = response_data.get('error', '未知错误')
+
+        # 服务端 /api/submit/{slug} 每次只接收一个文件，没有批量提交接口，
+        # 因此仍为每个文件单独发起请求，依靠 keep-alive 连接复用摊薄握手开销
+        async with AsyncHttpClient(config, limit=workers) as async_client:
+            await asyncio.gather(produce(), *[consume(async_client) for _ in range(workers)])
+
+        return success_mask, filenames, errors
+
 
 class ConcurrentSubmissionTest(TestCase):
     """并发提交测试"""
 
-    def __init__(self, count: int, concurrent: int, template_content: bytes):
+    def __init__(self, count: int, concurrent: int, generator: ExcelDataGenerator):
         super().__init__('并发提交测试', f'测试并发提交 {count} 个文件，{concurrent} 并发')
         self.count = count
         self.concurrent = concurrent
-        self.template_content = template_content
+        self.generator = generator
 
     def execute(self, client: HttpClient, config: TestConfig, db: MockDatabase) -> TestResult:
-        start_time = time.time()
-
-        async def submit_async(index: int, async_client: AsyncHttpClient) -> Dict:
-            """异步提交单个文件"""
-            try:
-                # 创建 Excel 数据生成器
-                generator = ExcelDataGenerator.create_from_template_content(self.template_content)
-
-                # 生成测试数据
-                test_data = generator.generate_rows(10)
-
-                # 生成 Excel 文件
-                excel_content = generator.generate_excel_file(test_data, include_header=True)
-
-                # 提交文件
-                user = config.test_user
-                success, response_data, duration = await async_client.submit_file_async(
-                    name=f'{user["name"]}_async_{index+1}',
-                    contact=str(int(user["contact"]) + index),
-                    department=user['department'],
-                    file_content=excel_content,
-                    file_name=f'{user["name"]}_async_{index+1}.xlsx',
-                    password=config.password
-                )
-
-                return {
-                    'index': index+1,
-                    'success': success,
-                    'duration': duration,
-                    'filename': response_data.get('filename', '') if success else '',
-                    'error': response_data.get('error', '') if not success else ''
-                }
-            except Exception as e:
-                return {
-                    'index': index+1,
-                    'success': False,
-                    'duration': 0,
-                    'error': str(e)
-                }
-
-        async def run_concurrent():
-            """运行并发提交"""
-            async_client = AsyncHttpClient(config)
-            tasks = [submit_async(i, async_client) for i in range(self.count)]
-            return await asyncio.gather(*tasks)
+        start_time = time.perf_counter()
+
+        user = config.test_user
+        base_name = user['name']
+        department = user['department']
+
+        # 结果按列存放：成功标记、耗时、文件名、错误信息
+        success_mask = bytearray(self.count)
+        durations = [0.0] * self.count
+        filenames = [''] * self.count
+        errors = [''] * self.count
+
+        async def submit_async(index: int, async_client: AsyncHttpClient, payloads: List[bytes], semaphore: asyncio.Semaphore, base_contact: int):
+            """异步提交单个文件（由信号量限制同时进行的上传数）"""
+            async with semaphore:
+                try:
+                    # 提交文件（轮询复用预生成的 Excel 内容）
+                    submitter = f'{base_name}_async_{index+1}'
+                    success, response_data, duration = await async_client.submit_file_async(
+                        name=submitter,
+                        contact=str(base_contact + index),
+                        department=department,
+                        file_content=payloads[index % len(payloads)],
+                        file_name=f'{submitter}.xlsx',
+                        password=config.password
+                    )
+
+                    durations[index] = duration
+                    if success:
+                        success_mask[index] = 1
+                        filenames[index] = response_data.get('filename', '')
+                    else:
+                        errors[index] = response_data.get('error', '')
+                except Exception as e:
+                    errors[index] = str(e)
+
+        async def run_concurrent(payloads: List[bytes]):
+            """运行并发提交（所有任务复用测试套件共享会话的 keep-alive 连接池，由信号量限制并发数）"""
+            semaphore = asyncio.Semaphore(self.concurrent)
+            # 联系方式只解析一次，各次提交在此基础上按序号递增
+            base_contact = int(user['contact'])
+            async with AsyncHttpClient(config, limit=self.concurrent) as async_client:
+                tasks = [submit_async(i, async_client, payloads, semaphore, base_contact) for i in range(self.count)]
+                completed = await asyncio.gather(*tasks, return_exceptions=True)
+
+            # 逃逸出 submit_async 的异常（如任务被取消）只记为该次提交失败，不影响其他任务
+            for i, result in enumerate(completed):
+                if isinstance(result, BaseException):
+                    errors[i] = str(result)
 
         try:
+            # 预生成 Excel 文件，使测试衡量的是上传吞吐而不是本地编码
+            payloads = build_excel_payloads(self.generator, self.count)
+
             # 运行并发提交
-            results = asyncio.run(run_concurrent())
+            config.run_async(run_concurrent(payloads))
 
             # 统计结果
-            success_count = sum(1 for r in results if r['success'])
-            failed_count = len(results) - success_count
-            total_duration = sum(r['duration'] for r in results)
+            success_count = sum(success_mask)
+            failed_count = self.count - success_count
+            total_duration = sum(durations)
+
+            # 只为报告中展示的前 10 个结果构造字典
+            results = [
+                {
+                    'index': i+1,
+                    'success': bool(success_mask[i]),
+                    'duration': durations[i],
+                    'filename': filenames[i],
+                    'error': errors[i]
+                }
+                for i in range(min(10, self.count))
+            ]
 
             # 保存到数据库
             db.insert('test_submissions', {
@@ -569,7 +661,7 @@ class ConcurrentSubmissionTest(TestCase):
                 test_name=self.name,
                 passed=success_count > 0,
                 message=f'并发提交完成: {success_count}/{self.count} 成功',
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 details={
                     'total_count': self.count,
                     'concurrent': self.concurrent,
@@ -577,7 +669,7 @@ class ConcurrentSubmissionTest(TestCase):
                     'failed_count': failed_count,
                     'success_rate': f'{success_count / self.count * 100:.1f}%',
                     'avg_duration': f'{total_duration / self.count:.2f}s',
-                    'results': results[:10]  # 只显示前10个结果
+                    'results': results  # 只显示前10个结果
                 }
             )
 
@@ -586,7 +678,7 @@ class ConcurrentSubmissionTest(TestCase):
                 test_name=self.name,
                 passed=False,
                 message=f'并发提交异常: {str(e)}',
-                duration=time.time() - start_time,
+                duration=time.perf_counter() - start_time,
                 error=str(e)
             )
 
@@ -599,95 +691,94 @@ class ErrorHandlingTest(TestCase):
         self.template_content = template_content
 
     def execute(self, client: HttpClient, config: TestConfig, db: MockDatabase) -> TestResult:
-        start_time = time.time()
+        start_time = time.perf_counter()
+
+        # 正常提交的请求参数，各场景只覆盖出错的字段（文件内容按引用共享）
+        user = config.test_user
+        base_request = {
+            'name': user['name'],
+            'contact': user['contact'],
+            'department': user['department'],
+            'file_content': self.template_content,
+            'file_name': 'test.xlsx',
+            'password': config.password
+        }
 
         # 定义错误测试场景
         error_scenarios = [
             {
                 'name': '密码错误测试',
-                'test': lambda: client.submit_file(
-                    name=config.test_user['name'],
-                    contact=config.test_user['contact'],
-                    department=config.test_user['department'],
-                    file_content=self.template_content,
-                    file_name='test.xlsx',
-                    password='wrong_password'  # 错误密码
-                ),
+                'request': {**base_request, 'password': 'wrong_password'},  # 错误密码
                 'expected_status': 'fail'
             },
             {
                 'name': '联系方式过长测试',
-                'test': lambda: client.submit_file(
-                    name=config.test_user['name'],
-                    contact='12345678901234567890',  # 超过15位
-                    department=config.test_user['department'],
-                    file_content=self.template_content,
-                    file_name='test.xlsx',
-                    password=config.password
-                ),
+                'request': {**base_request, 'contact': '12345678901234567890'},  # 超过15位
                 'expected_status': 'fail'
             },
             {
                 'name': '联系方式过短测试',
-                'test': lambda: client.submit_file(
-                    name=config.test_user['name'],
-                    contact='12',  # 少于3位
-                    department=config.test_user['department'],
-                    file_content=self.template_content,
-                    file_name='test.xlsx',
-                    password=config.password
-                ),
+                'request': {**base_request, 'contact': '12'},  # 少于3位
                 'expected_status': 'fail'
             },
             {
                 'name': '文件格式错误测试',
-                'test': lambda: client.submit_file(
-                    name=config.test_user['name'],
-                    contact=config.test_user['contact'],
-                    department=config.test_user['department'],
-                    file_content=b'invalid content',  # 无效的 Excel 内容
-                    file_name='test.txt',  # 错误的扩展名
-                    password=config.password
-                ),
+                'request': {
+                    **base_request,
+                    'file_content': b'invalid content',  # 无效的 Excel 内容
+                    'file_name': 'test.txt'  # 错误的扩展名
+                },
                 'expected_status': 'fail'
             }
         ]
 
-        test_results = []
+        test_results: List[Optional[Dict]] = [None] * len(error_scenarios)
+        db_rows: List[Optional[Dict]] = [None] * len(error_scenarios)
 
-        for scenario in error_scenarios:
-            try:
-                success, response_data, _ = scenario['test']()
+        # 各场景之间没有依赖，并行提交
+        with ThreadPoolExecutor(max_workers=len(error_scenarios)) as executor:
+            futures = {
+                executor.submit(client.submit_file, **scenario['request']): index
+                for index, scenario in enumerate(error_scenarios)
+            }
 
-                test_passed = (scenario['expected_status'] == 'fail' and not success) or \
-                             (scenario['expected_status'] == 'success' and success)
+            for future in as_completed(futures):
+                index = futures[future]
+                scenario = error_scenarios[index]
+                try:
+                    success, response_data, _ = future.result()
+
+                    test_passed = (scenario['expected_status'] == 'fail' and not success) or \
+                                 (scenario['expected_status'] == 'success' and success)
+
+                    test_results[index] = {
+                        'scenario': scenario['name'],
+                        'passed': test_passed,
+                        'expected': scenario['expected_status'],
+                        'actual': 'fail' if not success else 'success',
+                        'error': response_data.get('error') if not success else None
+                    }
 
-                test_results.append({
-                    'scenario': scenario['name'],
-                    'passed': test_passed,
-                    'expected': scenario['expected_status'],
-                    'actual': 'fail' if not success else 'success',
-                    'error': response_data.get('error') if not success else None
-                })
+                    # 暂存，全部完成后一次性写入模拟数据库
+                    db_rows[index] = {
+                        'scenario': scenario['name'],
+                        'passed': test_passed,
+                        'error': response_data.get('error') if not success else None,
+                        'status': 'error_test'
+                    }
 
-                # 保存到模拟数据库
-                db.insert('test_errors', {
-                    'scenario': scenario['name'],
-                    'passed': test_passed,
-                    'error': response_data.get('error') if not success else None,
-                    'status': 'error_test'
-                })
+                except Exception as e:
+                    test_results[index] = {
+                        'scenario': scenario['name'],
+                        'passed': False,
+                        'expected': scenario['expected_status'],
+                        'actual': 'exception',
+                        'error': str(e)
+                    }
 
-            except Exception as e:
-                test_results.append({
-                    'scenario': scenario['name'],
-                    'passed': False,
-                    'expected': scenario['expected_status'],
-                    'actual': 'exception',
-                    'error': str(e)
-                })
+        db.insert_many('test_errors', [row for row in db_rows if row is not None])
 
-        total_duration = time.time() - start_time
+        total_duration = time.perf_counter() - start_time
         passed_count = sum(1 for r in test_results if r['passed'])
 
         return TestResult(
@@ -716,6 +807,7 @@ class TestRunner:
         self.results: List[TestResult] = []
         self.test_cases: List[TestCase] = []  # 保存测试用例实例
         self.template_content = None
+        self.template_generator: Optional[ExcelDataGenerator] = None
         self.task_info = None
 
     def register_test(self, test_case: TestCase) -> TestResult:
@@ -727,8 +819,48 @@ class TestRunner:
         self.test_cases.append(test_case)  # 保存测试用例实例
         return result
 
+    def _parse_template(self) -> Optional[ExcelDataGenerator]:
+        """
+        解析下载的模板，失败时记录为失败的测试结果
+
+        Returns:
+            Excel 数据生成器，解析失败时返回 None
+        """
+        start_time = time.perf_counter()
+        try:
+            return ExcelDataGenerator.create_from_template_content(self.template_content)
+        except Exception as e:
+            result = TestResult(
+                test_name='模板解析',
+                passed=False,
+                message=f'模板解析失败: {str(e)}',
+                duration=time.perf_counter() - start_time,
+                error=str(e)
+            )
+            self.results.append(result)
+            print(f'✓ {result.test_name}: 失败 ({result.duration:.2f}s)')
+            return None
+
+    async def _open_async_session(self):
+        """在共享事件循环内创建批量与并发提交测试共享的异步会话"""
+        return AsyncHttpClient.create_session(self.config, limit=max(64, self.config.concurrent))
+
     def run_all(self) -> List[TestResult]:
-        """运行所有测试"""
+        """运行所有测试（所有异步测试共享同一事件循环和连接池，优先使用 uvloop）"""
+        loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+        self.config.event_loop = loop
+        self.config.async_session = loop.run_until_complete(self._open_async_session())
+
+        try:
+            return self._run_all()
+        finally:
+            loop.run_until_complete(self.config.async_session.close())
+            loop.close()
+            self.config.async_session = None
+            self.config.event_loop = None
+
+    def _run_all(self) -> List[TestResult]:
+        """依次执行所有测试用例"""
         print(f'\n开始文件收集功能测试...')
         print(f'Base API: {self.config.base_api}')
         print(f'Slug: {self.config.slug}')
@@ -748,34 +880,44 @@ class TestRunner:
         if result.passed and hasattr(template_test, 'template_content'):
             self.template_content = template_test.template_content
 
-        # 3. 数据生成测试
+        # 模板只解析一次，所有基于模板生成数据的测试共享同一个生成器
         if self.template_content:
-            result = self.register_test(DataGenerationTest(self.template_content))
+            self.template_generator = self._parse_template()
+
+        # 3. 数据生成测试
+        if self.template_generator:
+            result = self.register_test(DataGenerationTest(self.template_generator))
             print(f'✓ {result.test_name}: {"通过" if result.passed else "失败"} ({result.duration:.2f}s)')
 
         # 4. 文件提交测试（无附件）
-        if self.template_content:
-            result = self.register_test(FileSubmissionTest('文件提交测试（无附件）', '测试不带附件的文件提交', self.template_content, 10))
+        if self.template_generator:
+            result = self.register_test(FileSubmissionTest('文件提交测试（无附件）', '测试不带附件的文件提交', self.template_generator, 10))
             print(f'✓ {result.test_name}: {"通过" if result.passed else "失败"} ({result.duration:.2f}s)')
 
+        # 附件测试使用第 1 步已获取的任务信息中允许的扩展名
+        if self.task_info:
+            allowed_extensions = self.task_info.get('allowedExtensions', [])
+        else:
+            allowed_extensions = FileWithAttachmentTest.DEFAULT_EXTENSIONS
+
         # 5. 文件提交测试（单个附件）
-        if self.template_content:
-            result = self.register_test(FileWithAttachmentTest('文件提交测试（单个附件）', '测试带单个附件的文件提交', self.template_content, 1))
+        if self.template_generator:
+            result = self.register_test(FileWithAttachmentTest('文件提交测试（单个附件）', '测试带单个附件的文件提交', self.template_generator, 1, allowed_extensions))
             print(f'✓ {result.test_name}: {"通过" if result.passed else "失败"} ({result.duration:.2f}s)')
 
         # 6. 文件提交测试（多个附件）
-        if self.template_content:
-            result = self.register_test(FileWithAttachmentTest('文件提交测试（多个附件）', '测试带多个附件的文件提交', self.template_content, 3))
+        if self.template_generator:
+            result = self.register_test(FileWithAttachmentTest('文件提交测试（多个附件）', '测试带多个附件的文件提交', self.template_generator, 3, allowed_extensions))
             print(f'✓ {result.test_name}: {"通过" if result.passed else "失败"} ({result.duration:.2f}s)')
 
         # 7. 批量提交测试
-        if self.template_content:
-            result = self.register_test(BatchSubmissionTest(self.config.batch_count, self.template_content))
+        if self.template_generator:
+            result = self.register_test(BatchSubmissionTest(self.config.batch_count, self.template_generator))
             print(f'✓ {result.test_name}: {"通过" if result.passed else "失败"} ({result.duration:.2f}s)')
 
         # 8. 并发提交测试
-        if self.template_content:
-            result = self.register_test(ConcurrentSubmissionTest(self.config.batch_count, self.config.concurrent, self.template_content))
+        if self.template_generator:
+            result = self.register_test(ConcurrentSubmissionTest(self.config.batch_count, self.config.concurrent, self.template_generator))
             print(f'✓ {result.test_name}: {"通过" if result.passed else "失败"} ({result.duration:.2f}s)')
 
         # 9. 错误处理测试
@@ -813,16 +955,10 @@ def main():
 
     args = parser.parse_args()
 
-    # 确定批量配置
-    if args.count:
-        batch_count = args.count
-    else:
-        batch_count = BATCH_CONFIGS[args.batch]['count']
-
-    if args.concurrent:
-        concurrent = args.concurrent
-    else:
-        concurrent = BATCH_CONFIGS[args.batch]['concurrent']
+    # 确定批量配置（未自定义时使用预设值）
+    preset = BATCH_CONFIGS[args.batch]
+    batch_count = args.count or preset['count']
+    concurrent = args.concurrent or preset['concurrent']
 
     # 创建测试配置
     config = TestConfig(
@@ -851,16 +987,18 @@ def main():
     if runner.task_info:
         additional_info['task_info'] = runner.task_info
 
-    # 生成报告内容
-    report_content = report_generator.generate_markdown_report(results, config, additional_info)
-
-    # 保存报告
+    # 边生成边保存报告
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     report_filename = f'file_collection_test_report_{timestamp}.md'
-    report_path = report_generator.save_report(report_content, report_filename)
+    report_path = report_generator.save_report_streaming(
+        report_filename, results, config, additional_info
+    )
 
     print(f'\n测试报告已保存: {report_path}')
 
+    # 报告所需数据均已获取，释放连接池
+    runner.client.close()
+
     # 显示测试结果摘要
     passed_count = sum(1 for r in results if r.passed)
     print(f'\n测试结果摘要:')
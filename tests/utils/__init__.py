@@ -7,6 +7,7 @@ from .test_base import TestConfig, TestResult, TestCase, MockDatabase
 from .http_client import HttpClient, AsyncHttpClient
 from .excel_generator import ExcelDataGenerator
 from .file_utils import FileUtils
+from .random_utils import RandomUtils
 from .report_generator import ReportGenerator
 
 __all__ = [
@@ -18,5 +19,6 @@ __all__ = [
     'AsyncHttpClient',
     'ExcelDataGenerator',
     'FileUtils',
+    'RandomUtils',
     'ReportGenerator',
 ]
\ No newline at end of file
@@ -5,10 +5,18 @@ Excel 数据生成器
 支持基于表头智能识别字段类型并生成相应的测试数据
 """
 
+import os
 import random
+import re
+import posixpath
 import string
+import hashlib
+import zipfile
+import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from itertools import chain
+from operator import itemgetter
+from typing import Callable, List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple, Union
 from io import BytesIO
 
 try:
@@ -17,6 +25,13 @@ try:
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
+try:
+    # Rust 实现的 xlsx 写入器，直接接收记录列表一次性序列化
+    from rustpy_xlsxwriter import FastExcel
+    FAST_EXCEL_AVAILABLE = True
+except ImportError:
+    FAST_EXCEL_AVAILABLE = False
+
 try:
     from faker import Faker
     FAKER_AVAILABLE = True
@@ -24,6 +39,15 @@ try:
 except ImportError:
     FAKER_AVAILABLE = False
 
+from .random_utils import RandomUtils
+
+# xlsx 包内 XML 使用的命名空间
+XLSX_MAIN_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+XLSX_REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+XLSX_PKG_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+# 可直接取文本作为表头的单元格类型（共享字符串、内联字符串、字符串结果）
+XLSX_TEXT_CELL_TYPES = frozenset(('s', 'inlineStr', 'str'))
+
 
 class ExcelDataGenerator:
     """Excel 数据生成器"""
@@ -54,6 +78,57 @@ class ExcelDataGenerator:
         '杭州市西湖区', '成都市武侯区', '武汉市江汉区', '南京市鼓楼区'
     ]
 
+    # 手机号前缀
+    PHONE_PREFIXES = [
+        '130', '131', '132', '133', '134', '135', '136', '137', '138', '139',
+        '150', '151', '152', '153', '155', '156', '157', '158', '159',
+        '180', '181', '182', '183', '184', '185', '186', '187', '188', '189'
+    ]
+
+    # 各字段类型的表头关键字（按推断优先级排列）
+    FIELD_TYPE_KEYWORDS = {
+        'name': ['姓名', '人名', '用户', 'name'],                      # 姓名相关
+        'age': ['年龄', '岁数', 'age'],                                # 年龄相关
+        'phone': ['电话', '手机', '联系方式', 'phone', 'tel'],         # 电话相关
+        'email': ['邮箱', 'email', 'mail'],                            # 邮箱相关
+        'id_card': ['身份证', '证件号', 'id'],                          # 身份证相关
+        'date': ['日期', '时间', '生日', 'date', 'time'],              # 日期相关
+        'boolean': ['是否', '是', '否', '启用', '禁用', 'active'],     # 是否相关
+        'department': ['部门', '单位', 'department'],                  # 部门相关
+        'address': ['地址', '住址', 'address'],                        # 地址相关
+    }
+    FIELD_TYPE_ORDER = list(FIELD_TYPE_KEYWORDS)
+    FIELD_TYPE_PRIORITY = {field_type: index for index, field_type in enumerate(FIELD_TYPE_KEYWORDS)}
+
+    # 所有关键字编译为一个正则：前瞻使每个位置都参与匹配，命名分组给出匹配到的类型
+    FIELD_TYPE_PATTERN = re.compile('(?=' + '|'.join(
+        f'(?P<{field_type}>{"|".join(map(re.escape, keywords))})'
+        for field_type, keywords in FIELD_TYPE_KEYWORDS.items()
+    ) + ')')
+
+    # 已解析模板的 (表头, 字段类型) 缓存：内容模板按 BLAKE2 摘要、文件模板按 (路径, 修改时间) 索引
+    _TEMPLATE_CACHE: Dict[Any, Tuple[List[str], Dict[str, str]]] = {}
+
+    # 随机文本的候选字符
+    TEXT_CHARS = string.ascii_letters + string.digits
+
+    # 惰性生成数据时每块的行数
+    ROW_CHUNK_SIZE = 1000
+
+    # 字段类型到逐个生成方法名的映射（未列出的类型按 text 生成）
+    FIELD_GENERATORS = {
+        'name': '_generate_name',
+        'age': '_generate_age',
+        'phone': '_generate_phone',
+        'email': '_generate_email',
+        'id_card': '_generate_id_card',
+        'date': '_generate_date',
+        'boolean': '_generate_boolean',
+        'department': '_generate_department',
+        'address': '_generate_address',
+        'text': '_generate_text',
+    }
+
     def __init__(self, template_path: Optional[str] = None, template_content: Optional[bytes] = None):
         """
         初始化 Excel 数据生成器
@@ -70,36 +145,140 @@ class ExcelDataGenerator:
         self.headers = []
         self.field_types = {}
 
+        # 每个生成器使用独立的随机数生成器，多线程并发生成时互不争用
+        self._rnd = random.Random()
+
+        # 字段类型到绑定方法的映射只构建一次；逐行生成函数在首次生成时按表头编译
+        self._field_generators = {field_type: getattr(self, name) for field_type, name in self.FIELD_GENERATORS.items()}
+        self._row_function: Optional[Callable[[], Dict[str, Any]]] = None
+
         # 读取模板
         if template_path or template_content:
             self._read_template()
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """序列化时去掉绑定方法和编译出的逐行生成函数（不可 pickle），便于传给子进程"""
+        state = self.__dict__.copy()
+        del state['_field_generators'], state['_rnd']
+        state['_row_function'] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """反序列化后重新构建字段类型到绑定方法的映射，并使用新的随机数生成器（各副本生成的数据互不相同）"""
+        self.__dict__.update(state)
+        self._rnd = random.Random()
+        self._field_generators = {field_type: getattr(self, name) for field_type, name in self.FIELD_GENERATORS.items()}
+
+    @staticmethod
+    def _read_header_fast(source: Union[str, BytesIO]) -> List[str]:
+        """
+        直接解析 xlsx 包中的 XML，只读取活动工作表的第一行作为表头
+
+        不加载样式和其余行，遇到第一行结束即停止解析；
+        表头中有数字、布尔、日期或公式单元格时抛出 ValueError，由调用方回退到 openpyxl 以保持相同的取值
+
+        Args:
+            source: 模板文件路径或字节流
+
+        Returns:
+            表头列表（跳过空单元格）
+        """
+        with zipfile.ZipFile(source) as archive:
+            # 按 workbook.xml 中的活动工作表序号找到对应的工作表文件
+            workbook = ET.fromstring(archive.read('xl/workbook.xml'))
+            view = workbook.find(f'{XLSX_MAIN_NS}bookViews/{XLSX_MAIN_NS}workbookView')
+            active_tab = int(view.get('activeTab', 0)) if view is not None else 0
+            sheet = workbook.findall(f'{XLSX_MAIN_NS}sheets/{XLSX_MAIN_NS}sheet')[active_tab]
+            relation_id = sheet.get(f'{XLSX_REL_NS}id')
+
+            relations = ET.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+            target = next(
+                rel.get('Target') for rel in relations.iter(f'{XLSX_PKG_REL_NS}Relationship')
+                if rel.get('Id') == relation_id
+            )
+            sheet_path = target.lstrip('/') if target.startswith('/') else posixpath.normpath(f'xl/{target}')
+
+            # 共享字符串表（富文本由多个 <t> 片段拼接）
+            shared_strings = []
+            if 'xl/sharedStrings.xml' in archive.namelist():
+                sst = ET.fromstring(archive.read('xl/sharedStrings.xml'))
+                shared_strings = [''.join(t.text or '' for t in si.iter(f'{XLSX_MAIN_NS}t')) for si in sst.iter(f'{XLSX_MAIN_NS}si')]
+
+            headers = []
+            with archive.open(sheet_path) as sheet_stream:
+                for _, element in ET.iterparse(sheet_stream):
+                    if element.tag != f'{XLSX_MAIN_NS}row':
+                        continue
+                    # 第一行为空时 XML 中不存在 r="1" 的行
+                    if element.get('r', '1') != '1':
+                        break
+                    for cell in element.iter(f'{XLSX_MAIN_NS}c'):
+                        cell_type = cell.get('t')
+                        # 只直接解析纯文本单元格；数字、布尔、日期和公式单元格的取值与 openpyxl 不同，交由调用方回退
+                        has_value = cell.find(f'{XLSX_MAIN_NS}v') is not None or cell_type == 'inlineStr'
+                        if has_value and (cell_type not in XLSX_TEXT_CELL_TYPES or cell.find(f'{XLSX_MAIN_NS}f') is not None):
+                            raise ValueError(f'表头包含非文本单元格: {cell.get("r")}')
+                        if cell_type == 'inlineStr':
+                            value = ''.join(t.text or '' for t in cell.iter(f'{XLSX_MAIN_NS}t'))
+                        else:
+                            v = cell.find(f'{XLSX_MAIN_NS}v')
+                            value = v.text if v is not None else None
+                            if value is not None and cell_type == 's':
+                                value = shared_strings[int(value)]
+                        if value:
+                            headers.append(value.strip())
+                    break
+            return headers
+
     def _read_template(self):
         """读取模板文件，提取表头"""
         try:
             if self.template_content:
-                # 从字节内容读取
-                from openpyxl import load_workbook
-                wb = load_workbook(BytesIO(self.template_content))
-                ws = wb.active
+                cache_key = hashlib.blake2b(self.template_content, digest_size=16).digest()
             else:
-                # 从文件路径读取
-                from openpyxl import load_workbook
-                wb = load_workbook(self.template_path)
-                ws = wb.active
-
-            # 读取第一行作为表头
-            for cell in ws[1]:
-                if cell.value:
-                    self.headers.append(str(cell.value).strip())
-
-            # 推断每个字段的类型
-            for header in self.headers:
-                self.field_types[header] = self._infer_field_type(header)
+                cache_key = (self.template_path, os.path.getmtime(self.template_path))
+
+            cached = self._TEMPLATE_CACHE.get(cache_key)
+            if cached is None:
+                source = BytesIO(self.template_content) if self.template_content else self.template_path
+                try:
+                    headers = self._read_header_fast(source)
+                except Exception:
+                    # 包结构不符合预期时回退到 openpyxl 完整解析
+                    headers = self._read_header_with_openpyxl()
+
+                # 推断每个字段的类型
+                field_types = {header: self._infer_field_type(header) for header in headers}
+                cached = self._TEMPLATE_CACHE[cache_key] = (headers, field_types)
+
+            # 复制一份，避免实例修改表头时影响缓存
+            self.headers = list(cached[0])
+            self.field_types = dict(cached[1])
+            self._row_function = None
 
         except Exception as e:
             raise Exception(f'读取模板失败: {str(e)}')
 
+    def _read_header_with_openpyxl(self) -> List[str]:
+        """使用 openpyxl 加载整个模板并读取第一行表头"""
+        headers = []
+        if self.template_content:
+            # 从字节内容读取
+            from openpyxl import load_workbook
+            wb = load_workbook(BytesIO(self.template_content))
+            ws = wb.active
+        else:
+            # 从文件路径读取
+            from openpyxl import load_workbook
+            wb = load_workbook(self.template_path)
+            ws = wb.active
+
+        # 读取第一行作为表头
+        for cell in ws[1]:
+            if cell.value:
+                headers.append(str(cell.value).strip())
+        return headers
+
     def _infer_field_type(self, field_name: str) -> str:
         """
         根据表头名称推断字段类型
@@ -110,67 +289,30 @@ class ExcelDataGenerator:
         Returns:
             字段类型
         """
-        field_name_lower = field_name.lower()
-
-        # 姓名相关
-        if any(keyword in field_name for keyword in ['姓名', '人名', '用户', 'name']):
-            return 'name'
-
-        # 年龄相关
-        if any(keyword in field_name for keyword in ['年龄', '岁数', 'age']):
-            return 'age'
-
-        # 电话相关
-        if any(keyword in field_name for keyword in ['电话', '手机', '联系方式', 'phone', 'tel']):
-            return 'phone'
-
-        # 邮箱相关
-        if any(keyword in field_name for keyword in ['邮箱', 'email', 'mail']):
-            return 'email'
-
-        # 身份证相关
-        if any(keyword in field_name for keyword in ['身份证', '证件号', 'id']):
-            return 'id_card'
-
-        # 日期相关
-        if any(keyword in field_name for keyword in ['日期', '时间', '生日', 'date', 'time']):
-            return 'date'
-
-        # 是否相关
-        if any(keyword in field_name for keyword in ['是否', '是', '否', '启用', '禁用', 'active']):
-            return 'boolean'
-
-        # 部门相关
-        if any(keyword in field_name for keyword in ['部门', '单位', 'department']):
-            return 'department'
-
-        # 地址相关
-        if any(keyword in field_name for keyword in ['地址', '住址', 'address']):
-            return 'address'
+        # 同一位置匹配到多个类型时前瞻分组按优先级取第一个，再在所有位置中取优先级最高的类型
+        priorities = [self.FIELD_TYPE_PRIORITY[match.lastgroup] for match in self.FIELD_TYPE_PATTERN.finditer(field_name)]
+        if priorities:
+            return self.FIELD_TYPE_ORDER[min(priorities)]
 
         # 默认为文本
         return 'text'
 
     def _generate_name(self) -> str:
         """生成中文姓名"""
-        surname = random.choice(self.SURNAMES)
-        name = random.choice(self.NAMES)
-        if random.random() > 0.5:
-            name += random.choice(self.NAMES)
+        surname = self._rnd.choice(self.SURNAMES)
+        name = self._rnd.choice(self.NAMES)
+        if self._rnd.random() > 0.5:
+            name += self._rnd.choice(self.NAMES)
         return surname + name
 
     def _generate_age(self) -> int:
         """生成年龄（18-65）"""
-        return random.randint(18, 65)
+        return self._rnd.randrange(18, 66)
 
     def _generate_phone(self) -> str:
         """生成手机号码"""
-        # 手机号前缀
-        prefixes = ['130', '131', '132', '133', '134', '135', '136', '137', '138', '139',
-                    '150', '151', '152', '153', '155', '156', '157', '158', '159',
-                    '180', '181', '182', '183', '184', '185', '186', '187', '188', '189']
-        prefix = random.choice(prefixes)
-        suffix = ''.join(random.choice(string.digits) for _ in range(8))
+        prefix = self._rnd.choice(self.PHONE_PREFIXES)
+        suffix = f'{self._rnd.randrange(10 ** 8):08d}'
         return prefix + suffix
 
     def _generate_email(self) -> str:
@@ -178,43 +320,43 @@ class ExcelDataGenerator:
         if FAKER_AVAILABLE:
             return fake.email()
         else:
-            username = ''.join(random.choice(string.ascii_lowercase) for _ in range(8))
+            username = ''.join(self._rnd.choices(string.ascii_lowercase, k=8))
             domains = ['qq.com', '163.com', 'gmail.com', 'outlook.com', 'hotmail.com']
-            return f'{username}@{random.choice(domains)}'
+            return f'{username}@{self._rnd.choice(domains)}'
 
     def _generate_id_card(self) -> str:
         """生成身份证号（18位）"""
         # 简化版身份证号生成（仅用于测试）
-        area_code = str(random.randint(110000, 659999))
-        birth_date = datetime(random.randint(1970, 2005), random.randint(1, 12), random.randint(1, 28)).strftime('%Y%m%d')
-        sequence_code = ''.join(random.choice(string.digits) for _ in range(3))
-        check_code = random.choice('0123456789X')
+        area_code = str(self._rnd.randrange(110000, 660000))
+        birth_date = datetime(self._rnd.randrange(1970, 2006), self._rnd.randrange(1, 13), self._rnd.randrange(1, 29)).strftime('%Y%m%d')
+        sequence_code = f'{self._rnd.randrange(1000):03d}'
+        check_code = self._rnd.choice('0123456789X')
         return area_code + birth_date + sequence_code + check_code
 
     def _generate_date(self) -> str:
         """生成日期"""
         start_date = datetime.now() - timedelta(days=365)
         end_date = datetime.now()
-        random_date = start_date + timedelta(days=random.randint(0, 365))
+        random_date = start_date + timedelta(days=self._rnd.randrange(0, 366))
         return random_date.strftime('%Y-%m-%d')
 
     def _generate_boolean(self) -> str:
         """生成布尔值（是/否）"""
-        return random.choice(['是', '否'])
+        return self._rnd.choice(['是', '否'])
 
     def _generate_department(self) -> str:
         """生成部门"""
-        return random.choice(self.DEPARTMENTS)
+        return self._rnd.choice(self.DEPARTMENTS)
 
     def _generate_address(self) -> str:
         """生成地址"""
         if FAKER_AVAILABLE:
             return fake.address()
         else:
-            street = random.randint(1, 999)
-            building = random.choice(['A', 'B', 'C', 'D'])
-            room = random.randint(1, 999)
-            base_address = random.choice(self.ADDRESSES)
+            street = self._rnd.randrange(1, 1000)
+            building = self._rnd.choice(['A', 'B', 'C', 'D'])
+            room = self._rnd.randrange(1, 1000)
+            base_address = self._rnd.choice(self.ADDRESSES)
             return f'{base_address}{street}号{building}栋{room}室'
 
     def _generate_text(self, length: int = 10) -> str:
@@ -222,45 +364,175 @@ class ExcelDataGenerator:
         if FAKER_AVAILABLE:
             return fake.sentence()[:length]
         else:
-            return ''.join(random.choice(string.ascii_letters + string.digits) for _ in range(length))
+            return ''.join(self._rnd.choices(self.TEXT_CHARS, k=length))
+
+    def _field_generator(self, field_type: str) -> Callable[[], Any]:
+        """
+        获取字段类型对应的逐个生成方法
+
+        Args:
+            field_type: 字段类型
+
+        Returns:
+            生成单个值的绑定方法
+        """
+        return self._field_generators.get(field_type, self._generate_text)
+
+    def _get_row_function(self) -> Callable[[], Tuple[Any, ...]]:
+        """
+        获取按当前表头特化的逐行生成函数（首次调用时生成源码并编译）
 
-    def generate_row(self) -> Dict[str, Any]:
+        生成的函数形如 lambda: (_g0(), _g1(), ...)，
+        直接调用各列的生成方法，省去逐行遍历表头和查找字段类型
+
+        Returns:
+            返回一行数据（按表头顺序的元组）的无参函数
+        """
+        if self._row_function is None:
+            namespace = {}
+            calls = []
+            for index, header in enumerate(self.headers):
+                namespace[f'_g{index}'] = self._field_generator(self.field_types.get(header, 'text'))
+                calls.append(f'_g{index}(), ')
+            source = f'def _row():\n    return ({"".join(calls)})\n'
+            exec(compile(source, '<ExcelDataGenerator.generate_row>', 'exec'), namespace)
+            self._row_function = namespace['_row']
+        return self._row_function
+
+    def generate_row(self) -> Tuple[Any, ...]:
         """
         生成一行数据
 
+        Returns:
+            按表头顺序排列的值
+        """
+        return self._get_row_function()()
+
+    def generate_row_dict(self) -> Dict[str, Any]:
+        """
+        生成一行数据（字典形式）
+
         Returns:
             字段名到值的映射
         """
-        row_data = {}
-
-        for header in self.headers:
-            field_type = self.field_types.get(header, 'text')
-
-            # 根据字段类型生成数据
-            if field_type == 'name':
-                value = self._generate_name()
-            elif field_type == 'age':
-                value = self._generate_age()
-            elif field_type == 'phone':
-                value = self._generate_phone()
-            elif field_type == 'email':
-                value = self._generate_email()
-            elif field_type == 'id_card':
-                value = self._generate_id_card()
-            elif field_type == 'date':
-                value = self._generate_date()
-            elif field_type == 'boolean':
-                value = self._generate_boolean()
-            elif field_type == 'department':
-                value = self._generate_department()
-            elif field_type == 'address':
-                value = self._generate_address()
-            else:  # text
-                value = self._generate_text()
-
-            row_data[header] = value
-
-        return row_data
+        return dict(zip(self.headers, self.generate_row()))
+
+    def _row_values_getter(self) -> Callable[[Dict[str, Any]], Sequence[Any]]:
+        """
+        获取按表头顺序取出一行各列值的函数
+
+        各行通常包含全部表头，此时由 itemgetter 一次取出所有值；缺少字段时回退为逐列 get，缺失值为空字符串
+
+        Returns:
+            行字典到值序列的函数
+        """
+        headers = list(self.headers)
+        if len(headers) < 2:
+            # itemgetter 只有一个键时返回单个值而非元组
+            return lambda row_data: [row_data.get(header, '') for header in headers]
+
+        getter = itemgetter(*headers)
+
+        def row_values(row_data: Dict[str, Any]) -> Sequence[Any]:
+            try:
+                return getter(row_data)
+            except KeyError:
+                return [row_data.get(header, '') for header in headers]
+
+        return row_values
+
+    def _bulk_names(self, count: int) -> List[str]:
+        """批量生成中文姓名（各部分的随机数整列一次抽取）"""
+        surnames = RandomUtils.choices(self.SURNAMES, count)
+        first_names = RandomUtils.choices(self.NAMES, count)
+        second_names = RandomUtils.choices(self.NAMES, count)
+        # 约一半的姓名为双字名
+        double_flags = RandomUtils.choices((False, True), count)
+        return [
+            surname + first + (second if double else '')
+            for surname, first, second, double in zip(surnames, first_names, second_names, double_flags)
+        ]
+
+    def _bulk_phones(self, count: int) -> List[str]:
+        """批量生成手机号码（前缀和 8 位后缀整列一次抽取）"""
+        prefixes = RandomUtils.choices(self.PHONE_PREFIXES, count)
+        suffixes = RandomUtils.choices(range(10 ** 8), count)
+        return [f'{prefix}{suffix:08d}' for prefix, suffix in zip(prefixes, suffixes)]
+
+    def _bulk_id_cards(self, count: int) -> List[str]:
+        """批量生成身份证号（18位，各段数字整列一次抽取）"""
+        area_codes = RandomUtils.choices(range(110000, 660000), count)
+        years = RandomUtils.choices(range(1970, 2006), count)
+        months = RandomUtils.choices(range(1, 13), count)
+        days = RandomUtils.choices(range(1, 29), count)
+        sequence_codes = RandomUtils.choices(range(1000), count)
+        check_codes = RandomUtils.choices(list('0123456789X'), count)
+        return [
+            f'{area}{year}{month:02d}{day:02d}{sequence:03d}{check}'
+            for area, year, month, day, sequence, check
+            in zip(area_codes, years, months, days, sequence_codes, check_codes)
+        ]
+
+    def _bulk_addresses(self, count: int) -> List[str]:
+        """批量生成地址（未安装 Faker 时各部分整列一次抽取）"""
+        if FAKER_AVAILABLE:
+            return [fake.address() for _ in range(count)]
+        base_addresses = RandomUtils.choices(self.ADDRESSES, count)
+        streets = RandomUtils.choices(range(1, 1000), count)
+        buildings = RandomUtils.choices(['A', 'B', 'C', 'D'], count)
+        rooms = RandomUtils.choices(range(1, 1000), count)
+        return [
+            f'{base_address}{street}号{building}栋{room}室'
+            for base_address, street, building, room
+            in zip(base_addresses, streets, buildings, rooms)
+        ]
+
+    def _generate_column(self, field_type: str, count: int) -> List[Any]:
+        """
+        按列生成同一字段的多个值，数值、日期和枚举类字段整列一次抽样
+
+        Args:
+            field_type: 字段类型
+            count: 值的个数
+
+        Returns:
+            该列的值列表
+        """
+        if field_type == 'age':
+            return RandomUtils.choices(range(18, 66), count)
+        if field_type == 'date':
+            start_date = datetime.now() - timedelta(days=365)
+            dates = [(start_date + timedelta(days=offset)).strftime('%Y-%m-%d') for offset in range(366)]
+            return RandomUtils.choices(dates, count)
+        if field_type == 'boolean':
+            return RandomUtils.choices(['是', '否'], count)
+        if field_type == 'department':
+            return RandomUtils.choices(self.DEPARTMENTS, count)
+        if field_type == 'name':
+            return self._bulk_names(count)
+        if field_type == 'phone':
+            return self._bulk_phones(count)
+        if field_type == 'id_card':
+            return self._bulk_id_cards(count)
+        if field_type == 'address':
+            return self._bulk_addresses(count)
+
+        # 其余类型需要逐个拼接字符串
+        generate = self._field_generator(field_type)
+        return [generate() for _ in range(count)]
+
+    def iter_rows(self, count: int) -> Iterator[Dict[str, Any]]:
+        """
+        惰性生成多行数据（每次按列批量生成一块），内存占用与总行数无关
+
+        Args:
+            count: 行数
+
+        Returns:
+            逐行产出数据的迭代器
+        """
+        for chunk_start in range(0, count, self.ROW_CHUNK_SIZE):
+            yield from self._generate_row_chunk(min(self.ROW_CHUNK_SIZE, count - chunk_start))
 
     def generate_rows(self, count: int) -> List[Dict[str, Any]]:
         """
@@ -272,7 +544,116 @@ class ExcelDataGenerator:
         Returns:
             数据列表
         """
-        return [self.generate_row() for _ in range(count)]
+        return list(self.iter_rows(count))
+
+    def generate_columns(self, count: int) -> List[List[Any]]:
+        """
+        按列生成多行数据（每个表头位置对应一列值，不构造逐行的字典）
+
+        按位置而不是表头名组织，重复的表头各自对应一列，与 self.headers 一一对齐
+
+        Args:
+            count: 行数
+
+        Returns:
+            各列值列表组成的列表（与 self.headers 顺序一致）
+        """
+        return [self._generate_column(self.field_types.get(header, 'text'), count) for header in self.headers]
+
+    def _generate_row_chunk(self, count: int) -> List[Dict[str, Any]]:
+        """
+        生成一块数据（先按列批量生成，再组装成行）
+
+        Args:
+            count: 行数
+
+        Returns:
+            数据列表
+        """
+        columns = self.generate_columns(count)
+        if not columns:
+            return [{} for _ in range(count)]
+
+        headers = self.headers
+        return [dict(zip(headers, values)) for values in zip(*columns)]
+
+    @staticmethod
+    def _save_workbook(wb: 'Workbook') -> bytes:
+        """
+        将工作簿保存为字节内容
+
+        BytesIO.getvalue() 在缓冲区未被导出时直接返回内部的 bytes 对象而不复制，
+        返回的 bytes 再包装为 BytesIO 上传时同样共享内存，因此整个过程只有一份文件内容
+
+        Args:
+            wb: openpyxl 工作簿
+
+        Returns:
+            Excel 文件的字节内容
+        """
+        buffer = BytesIO()
+        wb.save(buffer)
+        return buffer.getvalue()
+
+    def _can_use_fast_excel(self) -> bool:
+        """
+        判断能否使用 Rust 写入器：它以记录的键作为表头，重复的表头会被合并，此时只能走 openpyxl 路径
+
+        Returns:
+            已安装 Rust 写入器且表头非空、无重复时为 True
+        """
+        headers = self.headers
+        return FAST_EXCEL_AVAILABLE and bool(headers) and len(set(headers)) == len(headers)
+
+    def _generate_with_fast_excel(self, data: Iterable[Dict[str, Any]]) -> bytes:
+        """
+        使用 Rust 实现的写入器生成带表头的 Excel 文件
+
+        写入器按首条记录的键确定表头并按位置写入后续各行，
+        因此每条记录先按表头重新组装（缺失字段为空字符串，多余字段丢弃），与 openpyxl 路径的输出一致
+
+        Args:
+            data: 数据列表或逐行产出数据的迭代器（非空，表头需非空且无重复）
+
+        Returns:
+            Excel 文件的字节内容
+        """
+        headers = self.headers
+        row_values = self._row_values_getter()
+        records = (dict(zip(headers, row_values(row_data))) for row_data in data)
+
+        buffer = BytesIO()
+        FastExcel(buffer).sheet("数据", records).save()
+        return buffer.getvalue()
+
+    def _generate_with_openpyxl(self, data: Iterable[Dict[str, Any]], include_header: bool = True) -> bytes:
+        """
+        使用 openpyxl 只写模式生成 Excel 文件（不创建单元格对象，逐行追加）
+
+        Args:
+            data: 数据列表或逐行产出数据的迭代器
+            include_header: 是否包含表头
+
+        Returns:
+            Excel 文件的字节内容
+        """
+        if not OPENPYXL_AVAILABLE:
+            raise ImportError('openpyxl 库未安装，请先安装: pip install openpyxl')
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(title="数据")
+
+        # 写入表头
+        headers = self.headers
+        if include_header and headers:
+            ws.append(headers)
+
+        # 写入数据
+        row_values = self._row_values_getter()
+        for row_data in data:
+            ws.append(row_values(row_data))
+
+        return self._save_workbook(wb)
 
     def generate_excel_file(self, data: List[Dict[str, Any]], include_header: bool = True) -> bytes:
         """
@@ -285,30 +666,91 @@ class ExcelDataGenerator:
         Returns:
             Excel 文件的字节内容
         """
+        if include_header and data and self._can_use_fast_excel():
+            return self._generate_with_fast_excel(data)
+
+        return self._generate_with_openpyxl(data, include_header)
+
+    def generate_excel_file_fast(self, data: Iterable[Dict[str, Any]]) -> bytes:
+        """
+        以只写模式快速生成带表头的 Excel 文件（不创建单元格对象，内存占用恒定）
+
+        Args:
+            data: 数据列表，或 iter_rows 返回的迭代器（逐行写入，不必先生成全部数据）
+
+        Returns:
+            Excel 文件的字节内容
+        """
+        rows = iter(data)
+        first_row = next(rows, None)
+        if first_row is not None:
+            rows = chain((first_row,), rows)
+            if self._can_use_fast_excel():
+                return self._generate_with_fast_excel(rows)
+
+        return self._generate_with_openpyxl(rows)
+
+    def generate_and_write(self, count: int, include_header: bool = True) -> bytes:
+        """
+        边生成数据边写入 Excel 文件（每次按列生成一块后逐行追加，不保留整份数据）
+
+        Args:
+            count: 行数
+            include_header: 是否包含表头
+
+        Returns:
+            Excel 文件的字节内容
+        """
+        headers = self.headers
+        if include_header and count > 0 and self._can_use_fast_excel():
+            return self._generate_with_fast_excel(self.iter_rows(count))
+
         if not OPENPYXL_AVAILABLE:
             raise ImportError('openpyxl 库未安装，请先安装: pip install openpyxl')
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "数据"
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(title="数据")
 
-        # 写入表头
-        if include_header and self.headers:
-            for col_idx, header in enumerate(self.headers, start=1):
-                ws.cell(row=1, column=col_idx, value=header)
+        if include_header and headers:
+            ws.append(headers)
+        if headers:
+            # 按表头位置逐列生成（重复的表头各自占一列）
+            for chunk_start in range(0, count, self.ROW_CHUNK_SIZE):
+                columns = self.generate_columns(min(self.ROW_CHUNK_SIZE, count - chunk_start))
+                for values in zip(*columns):
+                    ws.append(values)
 
-        # 写入数据
-        start_row = 2 if include_header else 1
-        for row_idx, row_data in enumerate(data, start=start_row):
-            for col_idx, header in enumerate(self.headers, start=1):
-                value = row_data.get(header, '')
-                ws.cell(row=row_idx, column=col_idx, value=value)
+        return self._save_workbook(wb)
 
-        # 保存到字节流
-        buffer = BytesIO()
-        wb.save(buffer)
-        content = buffer.getvalue()
-        return content
+    def generate_excel_file_from_columns(self, columns: List[List[Any]]) -> bytes:
+        """
+        由 generate_columns 生成的列数据生成带表头的 Excel 文件（openpyxl 路径逐行写入元组，不构造字典）
+
+        Args:
+            columns: 各列值列表（与 self.headers 按位置对齐）
+
+        Returns:
+            Excel 文件的字节内容
+        """
+        headers = self.headers
+        rows = zip(*columns)
+
+        if any(columns) and self._can_use_fast_excel():
+            # Rust 写入器只接收记录，在写入时逐行组装
+            return self._generate_with_fast_excel(dict(zip(headers, values)) for values in rows)
+
+        if not OPENPYXL_AVAILABLE:
+            raise ImportError('openpyxl 库未安装，请先安装: pip install openpyxl')
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(title="数据")
+
+        if headers:
+            ws.append(headers)
+        for values in rows:
+            ws.append(values)
+
+        return self._save_workbook(wb)
 
     def get_headers(self) -> List[str]:
         """
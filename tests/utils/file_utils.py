@@ -6,7 +6,19 @@
 """
 
 import os
-from typing import Tuple
+from typing import Collection, Tuple
+
+# Excel 文件允许的扩展名（已小写，供 validate_file_extension 做 O(1) 查找）
+ALLOWED_EXCEL_EXTENSIONS = frozenset({'.xlsx', '.xls'})
+
+# 文件大小单位（相邻单位相差 1024 倍）
+FILE_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# 保存文件时每次系统调用写入的字节数
+WRITE_CHUNK_SIZE = 1 << 20
+
+# 以二进制方式打开（Windows 下需要 O_BINARY，其他平台无此标志）
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
 
 
 class FileUtils:
@@ -25,12 +37,20 @@ class FileUtils:
             (成功标志, 消息)
         """
         try:
-            # 确保目录存在
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
-            # 写入文件
-            with open(filepath, 'wb') as f:
-                f.write(content)
+            # 确保目录存在（文件位于当前目录时无需创建）
+            dirpath = os.path.dirname(filepath)
+            if dirpath:
+                os.makedirs(dirpath, exist_ok=True)
+
+            # 绕过 Python 的文件缓冲，按 1MB 分块直接写入文件描述符
+            fd = os.open(filepath, _WRITE_FLAGS, 0o644)
+            try:
+                view = memoryview(content)
+                written = 0
+                while written < len(view):
+                    written += os.write(fd, view[written:written + WRITE_CHUNK_SIZE])
+            finally:
+                os.close(fd)
 
             return True, f'文件保存成功: {filepath}'
         except Exception as e:
@@ -50,15 +70,12 @@ class FileUtils:
         if size_bytes == 0:
             return '0 B'
 
-        units = ['B', 'KB', 'MB', 'GB', 'TB']
+        # 二进制位数每多 10 位大小就多一个 1024 倍，直接算出单位序号（不足 1 字节时按字节显示）
         unit_index = 0
-        size = float(size_bytes)
-
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
+        if size_bytes >= 1:
+            unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(FILE_SIZE_UNITS) - 1)
 
-        return f'{size:.2f} {units[unit_index]}'
+        return f'{size_bytes / (1 << (10 * unit_index)):.2f} {FILE_SIZE_UNITS[unit_index]}'
 
     @staticmethod
     def get_file_extension(filename: str) -> str:
@@ -69,7 +86,7 @@ class FileUtils:
             filename: 文件名
 
         Returns:
-            文件扩展名（包含点号，如 .xlsx）
+            小写的文件扩展名（包含点号，如 .xlsx），调用方无需再次转换大小写
         """
         _, ext = os.path.splitext(filename)
         return ext.lower()
@@ -95,13 +112,13 @@ class FileUtils:
         return True, f'文件大小验证通过: {FileUtils.format_file_size(file_size)}'
 
     @staticmethod
-    def validate_file_extension(filename: str, allowed_extensions: list) -> Tuple[bool, str]:
+    def validate_file_extension(filename: str, allowed_extensions: Collection[str] = ALLOWED_EXCEL_EXTENSIONS) -> Tuple[bool, str]:
         """
         验证文件扩展名
 
         Args:
             filename: 文件名
-            allowed_extensions: 允许的扩展名列表（如 ['.xlsx', '.xls']）
+            allowed_extensions: 允许的小写扩展名集合（如 ALLOWED_EXCEL_EXTENSIONS），传入 frozenset 时为 O(1) 查找
 
         Returns:
             (验证通过, 消息)
@@ -112,7 +129,8 @@ class FileUtils:
             return False, f'文件名无效: {filename}'
 
         if ext not in allowed_extensions:
-            return False, f'文件扩展名不支持: {ext}（允许的扩展名: {", ".join(allowed_extensions)}）'
+            # 允许的扩展名列表只在验证失败时拼接
+            return False, f'文件扩展名不支持: {ext}（允许的扩展名: {", ".join(sorted(allowed_extensions))}）'
 
         return True, f'文件扩展名验证通过: {ext}'
 
@@ -3,56 +3,374 @@
 """
 HTTP 客户端
 支持在线填表模式和文件收集模式的 API 调用
+JSON 编解码统一经由 dumps_json / loads_json，安装 orjson 时自动使用，否则回退到标准库
 """
 
 import time
 import json
-from typing import Dict, List, Any, Optional, Tuple
+import asyncio
+import threading
+from typing import Awaitable, BinaryIO, Callable, Dict, List, Any, Optional, Tuple, Union
 from io import BytesIO
 
 import requests
 import aiohttp
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .test_base import TestConfig
 
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# 上传内容：字节串或可读的文件对象
+UploadContent = Union[bytes, BinaryIO]
+
+# 错误响应体最多读取的字节数（避免完整读取体积较大的错误页面）
+ERROR_BODY_LIMIT = 4096
+
+
+def dumps_json(data: Any) -> str:
+    """
+    序列化 JSON 字符串（优先使用 orjson）
+
+    Args:
+        data: 待序列化的数据
+
+    Returns:
+        JSON 字符串（保留非 ASCII 字符）
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False)
+
+
+class PreSerializedJson(str):
+    """已序列化的 JSON 字符串标记，作为 jsonData 提交时原样发送（普通字符串仍会被序列化为 JSON 字符串）"""
+    __slots__ = ()
+
+
+def preserialize_json(data: Any) -> PreSerializedJson:
+    """
+    预先序列化 jsonData，同一份表单数据被多次提交时避免每次提交重复序列化
+
+    Args:
+        data: 表单数据
+
+    Returns:
+        带标记的 JSON 字符串
+    """
+    return PreSerializedJson(dumps_json(data))
+
+
+def encode_json_field(value: Any) -> str:
+    """
+    编码 jsonData 表单字段：PreSerializedJson 原样使用，其余值（包括普通字符串）序列化为 JSON
+
+    Args:
+        value: 表单数据或 preserialize_json 的返回值
+
+    Returns:
+        JSON 字符串
+    """
+    if type(value) is PreSerializedJson:
+        return str.__str__(value)
+    return dumps_json(value)
+
+
+def as_upload_stream(content: UploadContent) -> BinaryIO:
+    """
+    将上传内容包装为文件对象，供 aiohttp 按块读取发送，避免整体拷贝进请求缓冲区
+
+    Args:
+        content: 字节串或已打开的文件对象
+
+    Returns:
+        可读的文件对象
+    """
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return BytesIO(content)
+    return content
+
+
+def loads_json(content: bytes) -> Any:
+    """
+    解析 JSON 响应体（优先使用 orjson，直接解析字节串）
+
+    Args:
+        content: 响应体字节串
+
+    Returns:
+        解析后的 Python 对象
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def build_api_urls(config: TestConfig) -> Dict[str, str]:
+    """
+    按配置预先拼接各 API 地址，避免每次请求重复格式化
+
+    Args:
+        config: 测试配置
+
+    Returns:
+        接口名到 URL 的映射（附件下载地址需再拼接 "/{附件 ID}"）
+    """
+    base_api = config.base_api
+    slug = config.slug
+    return {
+        'schema': f"{base_api}/api/distribution/{slug}/schema",
+        'attachments': f"{base_api}/api/distribution/{slug}/attachments",
+        'submit': f"{base_api}/api/distribution/{slug}/submit",
+        'task_info': f"{base_api}/api/task/{slug}/info",
+        'template': f"{base_api}/api/template/{slug}",
+        'submit_file': f"{base_api}/api/submit/{slug}",
+        'departments': f"{base_api}/api/departments",
+    }
+
+
+def read_error_body(response: requests.Response, limit: int = ERROR_BODY_LIMIT) -> str:
+    """
+    读取错误响应体的前 limit 个字节（需以 stream=True 发起请求）
+
+    响应体不超过 limit 时会被完整读取，连接可以放回连接池复用
+
+    Args:
+        response: 流式响应
+        limit: 最多读取的字节数
+
+    Returns:
+        解码后的响应体片段
+    """
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=limit):
+        body += chunk
+        if len(body) >= limit:
+            break
+    return bytes(body[:limit]).decode('utf-8', errors='replace')
+
+
+async def read_error_body_async(response: aiohttp.ClientResponse, limit: int = ERROR_BODY_LIMIT) -> str:
+    """
+    读取 aiohttp 错误响应体的前 limit 个字节
+
+    Args:
+        response: aiohttp 响应
+        limit: 最多读取的字节数
+
+    Returns:
+        解码后的响应体片段
+    """
+    body = bytearray()
+    while len(body) < limit:
+        chunk = await response.content.read(limit - len(body))
+        if not chunk:
+            break
+        body += chunk
+    return bytes(body).decode('utf-8', errors='replace')
+
+
+# 进程内所有 HttpClient 共享的同步会话（首次使用时创建）、当前连接池大小及正在使用它的客户端数
+_shared_session: Optional[requests.Session] = None
+_shared_pool_size = 0
+_shared_session_refs = 0
+_shared_session_lock = threading.Lock()
+
 
 class HttpClient:
     """HTTP 请求客户端（同步）"""
 
+    # 连接池最小大小（并发数更大时按并发数扩容）
+    POOL_SIZE = 32
+
+    # 流式下载时每次读取的字节数
+    DOWNLOAD_CHUNK_SIZE = 1 << 16
+
     def __init__(self, config: TestConfig):
         self.config = config
-        self.session = requests.Session()
-        self.session.headers.update({
+        self._schema_cache: Optional[Dict] = None
+        # 配置在测试期间不变，URL 与密码请求头只构造一次
+        self._urls = build_api_urls(config)
+        self._password_headers = {'X-Password': config.password}
+        # 本客户端所需的连接池大小，以及是否已计入共享会话的使用者
+        self._pool_size = max(self.POOL_SIZE, config.concurrent)
+        self._holds_session = False
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        获取会话：首次使用时创建，之后进程内所有客户端复用同一连接池
+
+        连接池按所有客户端中最大的并发数配置，更大的客户端出现时扩容；
+        客户端首次使用会话时计入使用者，最后一个使用者 close() 时关闭会话
+
+        Returns:
+            复用 keep-alive 连接的会话
+        """
+        global _shared_session, _shared_pool_size, _shared_session_refs
+        session = _shared_session
+        if self._holds_session and session is not None and _shared_pool_size >= self._pool_size:
+            return session
+
+        # 测试用例可能在多个线程中并行执行，避免重复创建会话
+        with _shared_session_lock:
+            if not self._holds_session:
+                self._holds_session = True
+                _shared_session_refs += 1
+            if _shared_session is None:
+                _shared_session = self._create_session()
+                _shared_pool_size = self._pool_size
+            elif _shared_pool_size < self._pool_size:
+                # 挂载更大的连接池；进行中的请求继续使用原连接池，其连接随原适配器回收
+                self._mount_adapter(_shared_session, self._pool_size)
+                _shared_pool_size = self._pool_size
+            return _shared_session
+
+    @staticmethod
+    def _mount_adapter(session: requests.Session, pool_size: int):
+        """
+        为会话挂载指定大小的连接池
+
+        Args:
+            session: 会话
+            pool_size: 连接池大小
+        """
+        # 显式配置连接池，保持 keep-alive 连接复用；仅对幂等请求的连接错误和网关错误重试，重试耗尽时返回最后一次响应
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=(502, 503, 504), raise_on_status=False)
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+    def _create_session(self) -> requests.Session:
+        """
+        创建带连接池配置的会话
+
+        Returns:
+            新建的会话
+        """
+        session = requests.Session()
+        self._mount_adapter(session, self._pool_size)
+
+        session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': '*/*',
             'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8'
         })
+        return session
+
+    def close(self):
+        """释放本客户端对共享会话的使用；最后一个使用者释放时关闭会话及其 keep-alive 连接（之后再次请求时重新创建）"""
+        global _shared_session, _shared_pool_size, _shared_session_refs
+        with _shared_session_lock:
+            if not self._holds_session:
+                return
+            self._holds_session = False
+            _shared_session_refs -= 1
+            if _shared_session_refs == 0 and _shared_session is not None:
+                _shared_session.close()
+                _shared_session = None
+                _shared_pool_size = 0
+
+    def __enter__(self) -> 'HttpClient':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # ==================== 请求辅助方法 ====================
+
+    def _send_json(self, method: str, url: str, **kwargs) -> Tuple[bool, Dict, float]:
+        """
+        发送请求并解析 JSON 响应，统一计时与错误处理
+
+        Args:
+            method: HTTP 方法
+            url: 请求地址
+            **kwargs: 透传给 session.request 的参数（headers、data、files 等）
+
+        Returns:
+            (成功标志, 响应数据, 耗时)
+        """
+        start_time = time.perf_counter()
+        try:
+            # 流式请求：成功时读取完整响应体，失败时只读取错误信息的开头部分
+            with self.session.request(method, url, timeout=self.config.timeout, stream=True, **kwargs) as response:
+                if response.status_code == 200:
+                    content = response.content
+                    duration = time.perf_counter() - start_time
+                    return True, loads_json(content), duration
+                else:
+                    detail = read_error_body(response)
+                    duration = time.perf_counter() - start_time
+                    return False, {'error': f'HTTP {response.status_code}', 'detail': detail}, duration
+        except Exception as e:
+            duration = time.perf_counter() - start_time
+            return False, {'error': str(e)}, duration
+
+    def _get(self, url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[bool, Dict, float]:
+        """
+        发送 GET 请求并解析 JSON 响应
+
+        Args:
+            url: 请求地址
+            headers: 额外请求头（可选）
+
+        Returns:
+            (成功标志, 响应数据, 耗时)
+        """
+        return self._send_json('GET', url, headers=headers)
+
+    def _post(self, url: str, data: Dict, files: Optional[List] = None) -> Tuple[bool, Dict, float]:
+        """
+        发送 multipart 表单 POST 请求并解析 JSON 响应
+
+        Args:
+            url: 请求地址
+            data: 表单字段
+            files: 文件字段列表（可选）
+
+        Returns:
+            (成功标志, 响应数据, 耗时)
+        """
+        return self._send_json('POST', url, data=data, files=files or None)
 
     # ==================== 在线填表模式 API ====================
 
+    @property
+    def schema(self) -> Tuple[bool, Dict]:
+        """
+        获取缓存的 Schema，尚未成功获取过时才发起请求（失败结果不缓存）
+
+        Returns:
+            (成功标志, 响应数据)
+        """
+        if self._schema_cache is None:
+            success, data, _ = self.get_schema()
+            if not success:
+                return False, data
+        return True, self._schema_cache
+
     def get_schema(self) -> Tuple[bool, Dict, float]:
         """
-        获取 Schema（在线填表模式）
+        获取 Schema（在线填表模式），成功时同时刷新 Schema 缓存
 
         Returns:
             (成功标志, 响应数据, 耗时)
         """
-        url = f"{self.config.base_api}/api/distribution/{self.config.slug}/schema"
-        headers = {'X-Password': self.config.password}
-
-        start_time = time.time()
-        try:
-            response = self.session.get(url, headers=headers, timeout=self.config.timeout)
-            duration = time.time() - start_time
-
-            if response.status_code == 200:
-                data = response.json()
-                return True, data, duration
-            else:
-                return False, {'error': f'HTTP {response.status_code}', 'detail': response.text}, duration
-        except Exception as e:
-            duration = time.time() - start_time
-            return False, {'error': str(e)}, duration
+        success, data, duration = self._get(self._urls['schema'], headers=self._password_headers)
+        if success:
+            self._schema_cache = data
+        return success, data, duration
 
     def get_attachments_list(self) -> Tuple[bool, Dict, float]:
         """
@@ -61,61 +379,70 @@ class HttpClient:
         Returns:
             (成功标志, 响应数据, 耗时)
         """
-        url = f"{self.config.base_api}/api/distribution/{self.config.slug}/attachments"
-        headers = {'X-Password': self.config.password}
+        return self._get(self._urls['attachments'], headers=self._password_headers)
 
-        start_time = time.time()
+    def _download(self, url: str, sink: Optional[BinaryIO] = None) -> Tuple[bool, Union[bytes, BinaryIO], float]:
+        """
+        下载文件：未提供 sink 时返回完整内容，否则按块流式写入 sink，不在内存中保留整个响应体
+
+        Args:
+            url: 下载地址
+            sink: 可写的文件对象（可选）
+
+        Returns:
+            (成功标志, 文件内容或 sink, 耗时)
+        """
+        start_time = time.perf_counter()
         try:
-            response = self.session.get(url, headers=headers, timeout=self.config.timeout)
-            duration = time.time() - start_time
-
-            if response.status_code == 200:
-                data = response.json()
-                return True, data, duration
-            else:
-                return False, {'error': f'HTTP {response.status_code}', 'detail': response.text}, duration
+            with self.session.get(url, headers=self._password_headers, timeout=self.config.timeout, stream=sink is not None) as response:
+                if response.status_code != 200:
+                    return False, b'', time.perf_counter() - start_time
+
+                if sink is None:
+                    content = response.content
+                else:
+                    for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                        sink.write(chunk)
+                    content = sink
+                return True, content, time.perf_counter() - start_time
         except Exception as e:
-            duration = time.time() - start_time
-            return False, {'error': str(e)}, duration
+            duration = time.perf_counter() - start_time
+            return False, b'', duration
 
-    def download_attachment(self, attachment_id: int) -> Tuple[bool, bytes, float]:
+    def download_attachment(self, attachment_id: int, sink: Optional[BinaryIO] = None) -> Tuple[bool, Union[bytes, BinaryIO], float]:
         """
         下载附件（在线填表模式）
 
         Args:
             attachment_id: 附件 ID
+            sink: 可写的文件对象（可选，提供时流式写入其中）
 
         Returns:
-            (成功标志, 文件内容, 耗时)
+            (成功标志, 文件内容或 sink, 耗时)
         """
-        url = f"{self.config.base_api}/api/distribution/{self.config.slug}/attachments/{attachment_id}"
-        headers = {'X-Password': self.config.password}
-
-        start_time = time.time()
-        try:
-            response = self.session.get(url, headers=headers, timeout=self.config.timeout)
-            duration = time.time() - start_time
-
-            if response.status_code == 200:
-                return True, response.content, duration
-            else:
-                return False, b'', duration
-        except Exception as e:
-            duration = time.time() - start_time
-            return False, b'', duration
+        url = self._urls['attachments'] + '/' + str(attachment_id)
+        return self._download(url, sink)
 
-    def submit_form(self, data: Dict, files: Optional[List[Tuple[str, str, bytes]]] = None) -> Tuple[bool, Dict, float]:
+    def submit_form(
+        self,
+        data: Dict,
+        files: Optional[List[Tuple[str, str, bytes]]] = None,
+        slug: Optional[str] = None,
+        password: Optional[str] = None
+    ) -> Tuple[bool, Dict, float]:
         """
         提交表单（在线填表模式）
 
         Args:
             data: 表单数据
             files: 附件列表 [(字段名, 文件名, 内容)]
+            slug: 任务 Slug（默认使用配置中的 Slug）
+            password: 访问密码（默认使用配置中的密码）
 
         Returns:
             (成功标志, 响应数据, 耗时)
         """
-        url = f"{self.config.base_api}/api/distribution/{self.config.slug}/submit"
+        url = f"{self.config.base_api}/api/distribution/{slug}/submit" if slug else self._urls['submit']
 
         # 准备表单数据
         form_data = {}
@@ -123,48 +450,22 @@ class HttpClient:
             if key != 'jsonData':
                 form_data[key] = value
 
-        # jsonData 需要序列化为 JSON 字符串
+        # jsonData 需要序列化为 JSON 字符串（PreSerializedJson 原样使用）
         if 'jsonData' in data:
-            form_data['jsonData'] = json.dumps(data['jsonData'], ensure_ascii=False)
+            form_data['jsonData'] = encode_json_field(data['jsonData'])
 
         # 添加密码
-        form_data['password'] = self.config.password
+        form_data['password'] = password or self.config.password
 
         # 准备文件
         files_dict = None
         if files:
             files_dict = []
             for field_name, filename, content in files:
-                # 使用 BytesIO 包装字节串，创建类文件对象
-                file_obj = BytesIO(content)
-                files_dict.append((field_name, (filename, file_obj)))
+                # requests 会一次性构造整个请求体，直接传入字节串，无需包装为文件对象
+                files_dict.append((field_name, (filename, content, 'application/octet-stream')))
 
-        start_time = time.time()
-        try:
-            if files_dict:
-                response = self.session.post(
-                    url,
-                    data=form_data,
-                    files=files_dict,
-                    timeout=self.config.timeout
-                )
-            else:
-                response = self.session.post(
-                    url,
-                    data=form_data,
-                    timeout=self.config.timeout
-                )
-
-            duration = time.time() - start_time
-
-            if response.status_code == 200:
-                result = response.json()
-                return True, result, duration
-            else:
-                return False, {'error': f'HTTP {response.status_code}', 'detail': response.text}, duration
-        except Exception as e:
-            duration = time.time() - start_time
-            return False, {'error': str(e)}, duration
+        return self._post(url, form_data, files_dict)
 
     # ==================== 文件收集模式 API ====================
 
@@ -175,54 +476,29 @@ class HttpClient:
         Returns:
             (成功标志, 响应数据, 耗时)
         """
-        url = f"{self.config.base_api}/api/task/{self.config.slug}/info"
-
-        start_time = time.time()
-        try:
-            response = self.session.get(url, timeout=self.config.timeout)
-            duration = time.time() - start_time
-
-            if response.status_code == 200:
-                data = response.json()
-                return True, data, duration
-            else:
-                return False, {'error': f'HTTP {response.status_code}', 'detail': response.text}, duration
-        except Exception as e:
-            duration = time.time() - start_time
-            return False, {'error': str(e)}, duration
+        return self._get(self._urls['task_info'])
 
-    def download_template(self) -> Tuple[bool, bytes, float]:
+    def download_template(self, sink: Optional[BinaryIO] = None) -> Tuple[bool, Union[bytes, BinaryIO], float]:
         """
         下载 Excel 模板（文件收集模式）
 
+        Args:
+            sink: 可写的文件对象（可选，提供时流式写入其中）
+
         Returns:
-            (成功标志, 文件内容, 耗时)
+            (成功标志, 文件内容或 sink, 耗时)
         """
-        url = f"{self.config.base_api}/api/template/{self.config.slug}"
-        headers = {'X-Password': self.config.password}
-
-        start_time = time.time()
-        try:
-            response = self.session.get(url, headers=headers, timeout=self.config.timeout)
-            duration = time.time() - start_time
-
-            if response.status_code == 200:
-                return True, response.content, duration
-            else:
-                return False, b'', duration
-        except Exception as e:
-            duration = time.time() - start_time
-            return False, b'', duration
+        return self._download(self._urls['template'], sink)
 
     def submit_file(
         self,
         name: str,
         contact: str,
         department: str,
-        file_content: bytes,
+        file_content: UploadContent,
         file_name: str,
         password: Optional[str] = None,
-        attachments: Optional[List[Tuple[str, bytes]]] = None
+        attachments: Optional[List[Tuple[str, UploadContent]]] = None
     ) -> Tuple[bool, Dict, float]:
         """
         提交文件（文件收集模式）
@@ -231,7 +507,7 @@ class HttpClient:
             name: 提交人姓名
             contact: 联系方式
             department: 所属部门
-            file_content: Excel 文件内容
+            file_content: Excel 文件内容（字节串或文件对象）
             file_name: Excel 文件名
             password: 访问密码（如果任务设置了密码）
             attachments: 附件列表 [(文件名, 内容)]
@@ -239,7 +515,7 @@ class HttpClient:
         Returns:
             (成功标志, 响应数据, 耗时)
         """
-        url = f"{self.config.base_api}/api/submit/{self.config.slug}"
+        url = self._urls['submit_file']
 
         # 准备表单数据
         form_data = {
@@ -252,34 +528,17 @@ class HttpClient:
         if password:
             form_data['password'] = password
 
-        # 准备文件列表
+        # 准备文件列表（requests 会一次性构造整个请求体，字节串直接传入；文件对象由 requests 读取）
         files = [
-            ('file', (file_name, BytesIO(file_content), 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'))
+            ('file', (file_name, file_content, XLSX_CONTENT_TYPE))
         ]
 
         # 准备附件
         if attachments:
             for att_name, att_content in attachments:
-                files.append(('attachments', (att_name, BytesIO(att_content))))
+                files.append(('attachments', (att_name, att_content)))
 
-        start_time = time.time()
-        try:
-            response = self.session.post(
-                url,
-                data=form_data,
-                files=files,
-                timeout=self.config.timeout
-            )
-            duration = time.time() - start_time
-
-            if response.status_code == 200:
-                result = response.json()
-                return True, result, duration
-            else:
-                return False, {'error': f'HTTP {response.status_code}', 'detail': response.text}, duration
-        except Exception as e:
-            duration = time.time() - start_time
-            return False, {'error': str(e)}, duration
+        return self._post(url, form_data, files)
 
     def get_department_list(self) -> Tuple[bool, List[str], float]:
         """
@@ -288,96 +547,258 @@ class HttpClient:
         Returns:
             (成功标志, 部门列表, 耗时)
         """
-        url = f"{self.config.base_api}/api/departments"
-
-        start_time = time.time()
-        try:
-            response = self.session.get(url, timeout=self.config.timeout)
-            duration = time.time() - start_time
-
-            if response.status_code == 200:
-                data = response.json()
-                departments = data.get('departments', [])
-                return True, departments, duration
-            else:
-                return False, [], duration
-        except Exception as e:
-            duration = time.time() - start_time
-            return False, [], duration
+        success, data, duration = self._get(self._urls['departments'])
+        if success and isinstance(data, dict):
+            return True, data.get('departments', []), duration
+        return False, [], duration
 
 
 class AsyncHttpClient:
-    """HTTP 请求客户端（异步）"""
+    """
+    HTTP 请求客户端（异步）
 
-    def __init__(self, config: TestConfig):
+    会话在首次请求时创建，之后所有请求复用同一连接池；
+    通过 async with 或 close() 关闭自建的会话，测试套件共享的会话由其创建者关闭
+    """
+
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept': '*/*',
+        'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8'
+    }
+
+    def __init__(self, config: TestConfig, limit: int = 100):
+        """
+        初始化异步客户端
+
+        Args:
+            config: 测试配置（若其中设置了 async_session，则直接复用该会话）
+            limit: 自建会话时连接池的最大连接数
+        """
         self.config = config
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': '*/*',
-            'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8'
-        }
+        self.limit = limit
+        self._session: Optional[aiohttp.ClientSession] = None
+        # 配置在测试期间不变，URL 与密码请求头只构造一次
+        self._urls = build_api_urls(config)
+        self._password_headers = {'X-Password': config.password}
+
+    @classmethod
+    def create_session(cls, config: TestConfig, limit: int = 100) -> aiohttp.ClientSession:
+        """
+        创建复用 keep-alive 连接的会话（需在事件循环内调用）
+
+        Args:
+            config: 测试配置
+            limit: 连接池最大连接数
+
+        Returns:
+            新建的会话，由调用方负责关闭
+        """
+        # aiohttp 只支持 HTTP/1.1，无法多路复用：同时进行的请求数即连接数，
+        # 因此由 limit 限制连接数，并通过 keep-alive 在请求之间复用已建立的连接
+        connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit, ttl_dns_cache=300, keepalive_timeout=75)
+        timeout = aiohttp.ClientTimeout(total=config.timeout)
+        # 响应体统一用 loads_json 解析；json= 请求体的序列化同样走 orjson（不可用时回退标准库）
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers=cls.HEADERS,
+            json_serialize=dumps_json
+        )
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        获取会话：优先使用测试套件共享的会话，否则首次调用时自建
+
+        Returns:
+            复用 keep-alive 连接的会话
+        """
+        shared_session = self.config.async_session
+        if shared_session is not None and not shared_session.closed:
+            return shared_session
+
+        if self._session is None or self._session.closed:
+            self._session = self.create_session(self.config, self.limit)
+        return self._session
+
+    async def close(self):
+        """关闭自建的会话（共享会话由其创建者关闭）"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> 'AsyncHttpClient':
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @staticmethod
+    def _append_field(writer: aiohttp.MultipartWriter, name: str, value: str):
+        """向 multipart 写入器添加普通表单字段"""
+        part = writer.append(value)
+        part.set_content_disposition('form-data', name=name)
+
+    async def _gather_limited(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        calls: List[Dict[str, Any]],
+        concurrency: Optional[int] = None
+    ) -> List[Any]:
+        """
+        以有限并发执行一批请求，结果按调用顺序返回
+
+        Args:
+            func: 单次请求的协程函数
+            calls: 每次调用的关键字参数
+            concurrency: 同时进行的请求数（默认使用配置中的并发数）
+
+        Returns:
+            各次调用的返回值，抛出异常的调用对应位置为异常对象
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.config.concurrent))
+
+        async def run(kwargs: Dict[str, Any]) -> Any:
+            async with semaphore:
+                return await func(**kwargs)
+
+        return await asyncio.gather(*[run(kwargs) for kwargs in calls], return_exceptions=True)
 
     # ==================== 在线填表模式 API ====================
 
-    async def submit_form_async(self, data: Dict, files: Optional[List[Tuple[str, str, bytes]]] = None) -> Tuple[bool, Dict, float]:
+    async def submit_many(
+        self,
+        payloads: List[Dict],
+        files_per_payload: Optional[List[Optional[List[Tuple[str, str, bytes]]]]] = None,
+        concurrency: Optional[int] = None
+    ) -> List[Union[Tuple[bool, Dict, float], Exception]]:
+        """
+        并发提交多份表单（在线填表模式），复用同一会话
+
+        Args:
+            payloads: 各次提交的表单数据
+            files_per_payload: 各次提交的附件列表（可选，与 payloads 一一对应）
+            concurrency: 同时进行的提交数（默认使用配置中的并发数）
+
+        Returns:
+            与 payloads 顺序一致的 (成功标志, 响应数据, 耗时) 或异常对象
+        """
+        if files_per_payload is None:
+            calls = [{'data': data} for data in payloads]
+        else:
+            calls = [{'data': data, 'files': files} for data, files in zip(payloads, files_per_payload)]
+        return await self._gather_limited(self.submit_form_async, calls, concurrency)
+
+    async def submit_form_async(
+        self,
+        data: Dict,
+        files: Optional[List[Tuple[str, str, bytes]]] = None,
+        slug: Optional[str] = None,
+        password: Optional[str] = None
+    ) -> Tuple[bool, Dict, float]:
         """
         异步提交表单（在线填表模式）
 
         Args:
-            data: 表单数据
+            data: 表单数据（值为 None 的字段不提交）
             files: 附件列表 [(字段名, 文件名, 内容)]
+            slug: 任务 Slug（默认使用配置中的 Slug）
+            password: 访问密码（默认使用配置中的密码）
 
         Returns:
             (成功标志, 响应数据, 耗时)
         """
-        url = f"{self.config.base_api}/api/distribution/{self.config.slug}/submit"
+        url = f"{self.config.base_api}/api/distribution/{slug}/submit" if slug else self._urls['submit']
 
-        # 准备表单数据
-        form_data = aiohttp.FormData()
+        # 准备表单数据（multipart 写入器按块流式发送各部分）
+        writer = aiohttp.MultipartWriter('form-data')
         for key, value in data.items():
-            if key != 'jsonData':
-                form_data.add_field(key, str(value))
+            if key != 'jsonData' and value is not None:
+                self._append_field(writer, key, str(value))
 
-        # jsonData 需要序列化为 JSON 字符串
+        # jsonData 需要序列化为 JSON 字符串（PreSerializedJson 原样使用）
         if 'jsonData' in data:
-            form_data.add_field('jsonData', json.dumps(data['jsonData'], ensure_ascii=False))
+            self._append_field(writer, 'jsonData', encode_json_field(data['jsonData']))
 
         # 添加密码
-        form_data.add_field('password', self.config.password)
+        self._append_field(writer, 'password', password or self.config.password)
 
-        # 准备文件
+        # 准备文件（BytesIO 与原字节串共享缓冲区，发送时分块读取，不额外拷贝）
         if files:
             for field_name, filename, content in files:
-                form_data.add_field(field_name, content, filename=filename)
+                part = writer.append(BytesIO(content), {'Content-Type': 'application/octet-stream'})
+                part.set_content_disposition('form-data', name=field_name, filename=filename)
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
-            timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(url, data=form_data) as response:
-                    duration = time.time() - start_time
-
-                    if response.status == 200:
-                        result = await response.json()
-                        return True, result, duration
-                    else:
-                        text = await response.text()
-                        return False, {'error': f'HTTP {response.status}', 'detail': text}, duration
+            session = self._get_session()
+            async with session.post(url, data=writer) as response:
+                duration = time.perf_counter() - start_time
+
+                if response.status == 200:
+                    result = loads_json(await response.read())
+                    return True, result, duration
+                else:
+                    text = await read_error_body_async(response)
+                    return False, {'error': f'HTTP {response.status}', 'detail': text}, duration
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             return False, {'error': str(e)}, duration
 
+    async def download_attachment_async(self, attachment_id: int) -> Tuple[bool, bytes, float]:
+        """
+        异步下载附件（在线填表模式）
+
+        Args:
+            attachment_id: 附件 ID
+
+        Returns:
+            (成功标志, 文件内容, 耗时)
+        """
+        url = self._urls['attachments'] + '/' + str(attachment_id)
+
+        start_time = time.perf_counter()
+        try:
+            session = self._get_session()
+            async with session.get(url, headers=self._password_headers) as response:
+                if response.status == 200:
+                    content = await response.read()
+                    return True, content, time.perf_counter() - start_time
+                else:
+                    return False, b'', time.perf_counter() - start_time
+        except Exception:
+            duration = time.perf_counter() - start_time
+            return False, b'', duration
+
     # ==================== 文件收集模式 API ====================
 
+    async def submit_file_many(
+        self,
+        submissions: List[Dict[str, Any]],
+        concurrency: Optional[int] = None
+    ) -> List[Union[Tuple[bool, Dict, float], Exception]]:
+        """
+        并发提交多个文件（文件收集模式），复用同一会话
+
+        Args:
+            submissions: 各次提交的参数（与 submit_file_async 的关键字参数一致）
+            concurrency: 同时进行的提交数（默认使用配置中的并发数）
+
+        Returns:
+            与 submissions 顺序一致的 (成功标志, 响应数据, 耗时) 或异常对象
+        """
+        return await self._gather_limited(self.submit_file_async, submissions, concurrency)
+
     async def submit_file_async(
         self,
         name: str,
         contact: str,
         department: str,
-        file_content: bytes,
+        file_content: UploadContent,
         file_name: str,
         password: Optional[str] = None,
-        attachments: Optional[List[Tuple[str, bytes]]] = None
+        attachments: Optional[List[Tuple[str, UploadContent]]] = None
     ) -> Tuple[bool, Dict, float]:
         """
         异步提交文件（文件收集模式）
@@ -386,7 +807,7 @@ class AsyncHttpClient:
             name: 提交人姓名
             contact: 联系方式
             department: 所属部门
-            file_content: Excel 文件内容
+            file_content: Excel 文件内容（字节串或文件对象）
             file_name: Excel 文件名
             password: 访问密码（如果任务设置了密码）
             attachments: 附件列表 [(文件名, 内容)]
@@ -394,7 +815,7 @@ class AsyncHttpClient:
         Returns:
             (成功标志, 响应数据, 耗时)
         """
-        url = f"{self.config.base_api}/api/submit/{self.config.slug}"
+        url = self._urls['submit_file']
 
         # 准备表单数据
         form_data = aiohttp.FormData()
@@ -406,27 +827,26 @@ class AsyncHttpClient:
         if password:
             form_data.add_field('password', password)
 
-        # 准备主文件
-        form_data.add_field('file', file_content, filename=file_name, content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+        # 准备主文件（以文件对象传入，aiohttp 分块发送而不拷贝整个缓冲区）
+        form_data.add_field('file', as_upload_stream(file_content), filename=file_name, content_type=XLSX_CONTENT_TYPE)
 
         # 准备附件
         if attachments:
             for att_name, att_content in attachments:
-                form_data.add_field('attachments', att_content, filename=att_name)
+                form_data.add_field('attachments', as_upload_stream(att_content), filename=att_name)
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
-            timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(url, data=form_data) as response:
-                    duration = time.time() - start_time
-
-                    if response.status == 200:
-                        result = await response.json()
-                        return True, result, duration
-                    else:
-                        text = await response.text()
-                        return False, {'error': f'HTTP {response.status}', 'detail': text}, duration
+            session = self._get_session()
+            async with session.post(url, data=form_data) as response:
+                duration = time.perf_counter() - start_time
+
+                if response.status == 200:
+                    result = loads_json(await response.read())
+                    return True, result, duration
+                else:
+                    text = await read_error_body_async(response)
+                    return False, {'error': f'HTTP {response.status}', 'detail': text}, duration
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             return False, {'error': str(e)}, duration
\ No newline at end of file
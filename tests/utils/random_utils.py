@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+随机抽样工具类
+批量生成测试数据时使用，安装了 NumPy 时使用其向量化随机数生成器
+"""
+
+import random
+from typing import List, Sequence, Any
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+    # SFC64 位生成器在批量抽样时速度最快
+    _rng = np.random.Generator(np.random.SFC64())
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class RandomUtils:
+    """随机抽样工具类"""
+
+    @staticmethod
+    def choices(population: Sequence[Any], count: int) -> List[Any]:
+        """
+        从候选值中有放回地随机抽取多个值
+
+        Args:
+            population: 候选值序列（range 不会被展开）
+            count: 抽取数量
+
+        Returns:
+            抽取结果列表（元素均为 Python 原生类型）
+        """
+        if not NUMPY_AVAILABLE:
+            return random.choices(population, k=count)
+
+        indexes = _rng.integers(0, len(population), size=count)
+        if isinstance(population, range):
+            return (population.start + population.step * indexes).tolist()
+        return np.asarray(population)[indexes].tolist()
@@ -8,9 +8,22 @@
 import os
 import json
 from datetime import datetime
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Iterator, Union
 from .test_base import TestResult, TestConfig
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 class ReportGenerator:
     """测试报告生成器"""
@@ -35,181 +48,343 @@ class ReportGenerator:
         Returns:
             Markdown 格式的报告内容
         """
-        report_lines = []
+        return '\n'.join(self.iter_report_lines(results, config, additional_info))
+
+    def iter_report_lines(
+        self,
+        results: List[TestResult],
+        config: TestConfig,
+        additional_info: Dict[str, Any] = None
+    ) -> Iterator[str]:
+        """
+        逐行生成 Markdown 格式的测试报告
+
+        Args:
+            results: 测试结果列表
+            config: 测试配置
+            additional_info: 额外信息（如 Schema 信息、任务信息等）
+
+        Returns:
+            报告行的生成器（不含换行符），可直接交给 save_report 流式写入
+        """
+        total_count = len(results)
+        passed_count = 0
+        failed_results = []
+        percentiles = None
+        if NUMPY_AVAILABLE and total_count > 0:
+            # numpy 可用时耗时统计交给 numpy，并顺带计算尾部延迟
+            durations = np.fromiter((r.duration for r in results), dtype=np.float64, count=total_count)
+            total_duration = float(durations.sum())
+            max_duration = float(durations.max())
+            min_duration = float(durations.min())
+            percentiles = np.percentile(durations, (50, 95, 99))
+            for result in results:
+                if result.passed:
+                    passed_count += 1
+                else:
+                    failed_results.append(result)
+        else:
+            # 一次遍历汇总通过数、失败用例和耗时统计
+            total_duration = 0.0
+            max_duration = float('-inf')
+            min_duration = float('inf')
+            for result in results:
+                duration = result.duration
+                total_duration += duration
+                if duration > max_duration:
+                    max_duration = duration
+                if duration < min_duration:
+                    min_duration = duration
+                if result.passed:
+                    passed_count += 1
+                else:
+                    failed_results.append(result)
+
+        # 报告时间只格式化一次，概要和各用例共用
+        report_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         # 标题
-        report_lines.append('# 功能测试报告\n')
+        yield '# 功能测试报告\n'
 
         # 测试概要
-        report_lines.append('## 测试概要\n')
-        report_lines.append(f'- **测试时间**: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
-        report_lines.append(f'- **测试环境**: {config.base_api}')
-        report_lines.append(f'- **任务 Slug**: {config.slug}')
-        report_lines.append(f'- **批量提交**: {config.batch_count} 次, {config.concurrent} 并发')
-        report_lines.append(f'- **测试用例总数**: {len(results)}')
-        report_lines.append(f'- **通过用例数**: {sum(1 for r in results if r.passed)}')
-        report_lines.append(f'- **失败用例数**: {sum(1 for r in results if not r.passed)}')
-
-        if len(results) > 0:
-            report_lines.append(f'- **通过率**: {sum(1 for r in results if r.passed) / len(results) * 100:.1f}%\n')
+        yield '## 测试概要\n'
+        yield f'- **测试时间**: {report_time}'
+        yield f'- **测试环境**: {config.base_api}'
+        yield f'- **任务 Slug**: {config.slug}'
+        yield f'- **批量提交**: {config.batch_count} 次, {config.concurrent} 并发'
+        yield f'- **测试用例总数**: {total_count}'
+        yield f'- **通过用例数**: {passed_count}'
+        yield f'- **失败用例数**: {len(failed_results)}'
+
+        if total_count > 0:
+            yield f'- **通过率**: {passed_count / total_count * 100:.1f}%\n'
         else:
-            report_lines.append(f'- **通过率**: 0%\n')
+            yield f'- **通过率**: 0%\n'
 
         # 测试配置
-        report_lines.append('## 测试配置\n')
-        report_lines.append('| 配置项 | 值 |')
-        report_lines.append('|-------|-----|')
-        report_lines.append(f'| Base API | {config.base_api} |')
-        report_lines.append(f'| Slug | {config.slug} |')
-        report_lines.append(f'| 密码 | *** |')
-        report_lines.append(f'| 测试用户 | {config.test_user["name"]}, {config.test_user["contact"]}, {config.test_user["department"]} |')
-        report_lines.append(f'| 批量提交次数 | {config.batch_count} |')
-        report_lines.append(f'| 并发数 | {config.concurrent} |\n')
+        yield '## 测试配置\n'
+        yield '| 配置项 | 值 |'
+        yield '|-------|-----|'
+        yield f'| Base API | {config.base_api} |'
+        yield f'| Slug | {config.slug} |'
+        yield f'| 密码 | *** |'
+        yield f'| 测试用户 | {config.test_user["name"]}, {config.test_user["contact"]}, {config.test_user["department"]} |'
+        yield f'| 批量提交次数 | {config.batch_count} |'
+        yield f'| 并发数 | {config.concurrent} |\n'
 
         # 额外信息（如 Schema 信息、任务信息等）
         if additional_info:
-            self._append_additional_info(report_lines, additional_info)
+            yield from self._generate_additional_info(additional_info)
 
         # 测试用例详情
-        report_lines.append('## 测试用例详情\n')
+        yield '## 测试用例详情\n'
 
         for i, result in enumerate(results, 1):
             status_icon = '✅' if result.passed else '❌'
-            report_lines.append(f'### {i}. {result.test_name} {status_icon}\n')
-            report_lines.append(f'**测试时间**: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
-            report_lines.append(f'**响应时间**: {result.duration:.2f}s')
-            report_lines.append(f'**状态**: {"通过" if result.passed else "失败"}\n')
-            report_lines.append(f'**测试结果**: {result.message}\n')
+            yield f'### {i}. {result.test_name} {status_icon}\n'
+            yield f'**测试时间**: {report_time}'
+            duration_text = result._duration_text
+            if duration_text is None:
+                duration_text = result._duration_text = format(result.duration, '.2f')
+            yield f'**响应时间**: {duration_text}s'
+            yield f'**状态**: {"通过" if result.passed else "失败"}\n'
+            yield f'**测试结果**: {result.message}\n'
 
             if result.error:
-                report_lines.append(f'**错误信息**: {result.error}\n')
+                yield f'**错误信息**: {result.error}\n'
 
             if result.details:
-                report_lines.append('**详细信息**:\n')
-                self._format_details(report_lines, result.details)
+                yield '**详细信息**:\n'
+                yield from self._format_details(result.details)
 
             if result.response_data:
-                report_lines.append('**响应数据**:\n')
-                report_lines.append('```json')
-                report_lines.append(json.dumps(result.response_data, ensure_ascii=False, indent=2))
-                report_lines.append('```\n')
+                yield '**响应数据**:\n'
+                yield '```json'
+                yield self._response_json(result)
+                yield '```\n'
 
-            report_lines.append('---\n')
+            yield '---\n'
 
         # 性能统计
-        if len(results) > 0:
-            report_lines.append('## 性能统计\n')
-            report_lines.append('| 指标 | 值 |')
-            report_lines.append('|-----|-----|')
-            report_lines.append(f'| 平均响应时间 | {sum(r.duration for r in results) / len(results):.2f}s |')
-            report_lines.append(f'| 最大响应时间 | {max(r.duration for r in results):.2f}s |')
-            report_lines.append(f'| 最小响应时间 | {min(r.duration for r in results):.2f}s |')
-            report_lines.append(f'| 总测试时间 | {sum(r.duration for r in results):.2f}s |\n')
+        if total_count > 0:
+            yield '## 性能统计\n'
+            yield '| 指标 | 值 |'
+            yield '|-----|-----|'
+            yield f'| 平均响应时间 | {total_duration / total_count:.2f}s |'
+            yield f'| 最大响应时间 | {max_duration:.2f}s |'
+            yield f'| 最小响应时间 | {min_duration:.2f}s |'
+            if percentiles is not None:
+                p50, p95, p99 = percentiles
+                yield f'| P50 响应时间 | {p50:.2f}s |'
+                yield f'| P95 响应时间 | {p95:.2f}s |'
+                yield f'| P99 响应时间 | {p99:.2f}s |'
+            yield f'| 总测试时间 | {total_duration:.2f}s |\n'
 
         # 问题汇总
-        failed_results = [r for r in results if not r.passed]
         if failed_results:
-            report_lines.append('## 问题汇总\n')
-            report_lines.append('| 测试用例 | 错误信息 |')
-            report_lines.append('|---------|---------|')
+            yield '## 问题汇总\n'
+            yield '| 测试用例 | 错误信息 |'
+            yield '|---------|---------|'
             for result in failed_results:
                 error = result.error or '未知错误'
-                report_lines.append(f'| {result.test_name} | {error} |\n')
+                yield f'| {result.test_name} | {error} |\n'
         else:
-            report_lines.append('## 问题汇总\n')
-            report_lines.append('✅ 所有的测试用例都通过了！\n')
+            yield '## 问题汇总\n'
+            yield '✅ 所有的测试用例都通过了！\n'
 
         # 测试结论
-        report_lines.append('## 测试结论\n')
-        if all(r.passed for r in results):
-            report_lines.append('✅ **测试通过**: 所有功能正常工作\n')
+        yield '## 测试结论\n'
+        if not failed_results:
+            yield '✅ **测试通过**: 所有功能正常工作\n'
         else:
-            passed_count = sum(1 for r in results if r.passed)
-            report_lines.append(f'⚠️ **部分通过**: {passed_count}/{len(results)} 个测试用例通过\n')
+            yield f'⚠️ **部分通过**: {passed_count}/{total_count} 个测试用例通过\n'
 
-        return '\n'.join(report_lines)
-
-    def _append_additional_info(self, report_lines: List[str], additional_info: Dict[str, Any]):
+    def _generate_additional_info(self, additional_info: Dict[str, Any]) -> Iterator[str]:
         """
-        添加额外信息到报告
+        生成额外信息的报告行
 
         Args:
-            report_lines: 报告行列表
             additional_info: 额外信息字典
+
+        Returns:
+            报告行的生成器
         """
         # Schema 信息（在线填表模式）
         if 'schema' in additional_info:
             schema_data = additional_info['schema']
             if schema_data:
-                report_lines.append('## Schema 信息\n')
-                report_lines.append(f'- **标题**: {schema_data.get("title", "N/A")}')
-                report_lines.append(f'- **字段数量**: {len(schema_data.get("columns", []))}')
-                report_lines.append(f'- **允许附件上传**: {"是" if schema_data.get("allowAttachmentUpload", False) else "否"}\n')
+                yield '## Schema 信息\n'
+                yield f'- **标题**: {schema_data.get("title", "N/A")}'
+                yield f'- **字段数量**: {len(schema_data.get("columns", []))}'
+                yield f'- **允许附件上传**: {"是" if schema_data.get("allowAttachmentUpload", False) else "否"}\n'
 
                 if schema_data.get('columns'):
-                    report_lines.append('| 字段名称 | 字段类型 | 必填 |')
-                    report_lines.append('|---------|---------|------|')
+                    yield '| 字段名称 | 字段类型 | 必填 |'
+                    yield '|---------|---------|------|'
                     for column in schema_data['columns']:
-                        report_lines.append(f'| {column.get("name", "N/A")} | {column.get("type", "N/A")} | {"是" if column.get("required", False) else "否"} |')
-                    report_lines.append('')
+                        yield f'| {column.get("name", "N/A")} | {column.get("type", "N/A")} | {"是" if column.get("required", False) else "否"} |'
+                    yield ''
 
         # 任务信息（文件收集模式）
         if 'task_info' in additional_info:
             task_info = additional_info['task_info']
             if task_info:
-                report_lines.append('## 任务信息\n')
-                report_lines.append(f'- **任务标题**: {task_info.get("title", "N/A")}')
-                report_lines.append(f'- **任务类型**: {"文件收集" if task_info.get("taskType") == 0 else "在线填表"}')
-                report_lines.append(f'- **允许扩展名**: {", ".join(task_info.get("allowedExtensions", []))}')
-                report_lines.append(f'- **允许附件上传**: {"是" if task_info.get("allowAttachmentUpload", False) else "否"}')
-                report_lines.append(f'- **版本控制模式**: {task_info.get("versioningMode", "N/A")}\n')
+                yield '## 任务信息\n'
+                yield f'- **任务标题**: {task_info.get("title", "N/A")}'
+                yield f'- **任务类型**: {"文件收集" if task_info.get("taskType") == 0 else "在线填表"}'
+                yield f'- **允许扩展名**: {", ".join(task_info.get("allowedExtensions", []))}'
+                yield f'- **允许附件上传**: {"是" if task_info.get("allowAttachmentUpload", False) else "否"}'
+                yield f'- **版本控制模式**: {task_info.get("versioningMode", "N/A")}\n'
 
         # 模板信息（文件收集模式）
         if 'template_info' in additional_info:
             template_info = additional_info['template_info']
             if template_info:
-                report_lines.append('## 模板信息\n')
-                report_lines.append(f'- **模板文件名**: {template_info.get("filename", "N/A")}')
-                report_lines.append(f'- **表头数量**: {template_info.get("header_count", 0)}')
-                report_lines.append(f'- **表头列表**: {", ".join(template_info.get("headers", []))}\n')
+                yield '## 模板信息\n'
+                yield f'- **模板文件名**: {template_info.get("filename", "N/A")}'
+                yield f'- **表头数量**: {template_info.get("header_count", 0)}'
+                yield f'- **表头列表**: {", ".join(template_info.get("headers", []))}\n'
 
-    def _format_details(self, report_lines: List[str], details: Dict, indent: int = 0):
+    def _format_details(self, details: Dict, indent: int = 0) -> Iterator[str]:
         """
-        格式化详细信息
+        格式化详细信息（按值的类型查表分派，而不是逐个 isinstance 判断）
 
         Args:
-            report_lines: 报告行列表
             details: 详细信息字典
             indent: 缩进级别
-        """
-        prefix = '  ' * indent
 
+        Returns:
+            报告行的生成器
+        """
+        handlers = self._DETAIL_HANDLERS
         for key, value in details.items():
-            if isinstance(value, dict):
-                report_lines.append(f'{prefix}- **{key}**:')
-                self._format_details(report_lines, value, indent + 1)
-            elif isinstance(value, list):
-                report_lines.append(f'{prefix}- **{key}**:')
-                for item in value:
-                    if isinstance(item, dict):
-                        self._format_details(report_lines, item, indent + 1)
-                    else:
-                        report_lines.append(f'{prefix}  - {item}')
+            label = self._detail_label(indent, key)
+            value_type = type(value)
+            handler = handlers[value_type] if value_type in handlers else self._detail_handler(value_type)
+            if handler is None:
+                yield f'{label} {value}'
             else:
-                report_lines.append(f'{prefix}- **{key}**: {value}')
+                yield label
+                yield from handler(self, value, indent)
+
+    def _format_detail_dict(self, value: Dict, indent: int) -> Iterator[str]:
+        """展开嵌套字典（缩进加一级）"""
+        return self._format_details(value, indent + 1)
+
+    def _format_detail_list(self, value: List, indent: int) -> Iterator[str]:
+        """展开列表：字典元素递归展开，其余元素直接输出"""
+        handlers = self._DETAIL_HANDLERS
+        format_dict = ReportGenerator._format_detail_dict
+        item_prefix = f'{"  " * indent}  - '
+        for item in value:
+            item_type = type(item)
+            handler = handlers[item_type] if item_type in handlers else self._detail_handler(item_type)
+            if handler is format_dict:
+                yield from self._format_details(item, indent + 1)
+            else:
+                yield f'{item_prefix}{item}'
+
+    # 值类型 -> 展开方式（None 表示直接输出），子类型首次出现时解析并缓存
+    _DETAIL_HANDLERS = {dict: _format_detail_dict, list: _format_detail_list}
 
-    def save_report(self, content: str, filename: str):
+    @classmethod
+    def _detail_handler(cls, value_type: type):
         """
-        保存报告到文件
+        解析未登记类型的展开方式（dict / list 的子类沿用父类的处理），并登记到分派表
 
         Args:
-            content: 报告内容
+            value_type: 值的类型
+
+        Returns:
+            展开方法，无需展开时为 None
+        """
+        handler = None
+        if issubclass(value_type, dict):
+            handler = cls._DETAIL_HANDLERS[dict]
+        elif issubclass(value_type, list):
+            handler = cls._DETAIL_HANDLERS[list]
+        cls._DETAIL_HANDLERS[value_type] = handler
+        return handler
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _detail_label(indent: int, key: str) -> str:
+        """
+        生成详细信息条目的标签（批量结果中大量条目的键和缩进相同，缓存格式化结果）
+
+        Args:
+            indent: 缩进级别
+            key: 字段名
+
+        Returns:
+            形如 "  - **key**:" 的标签
+        """
+        return f'{"  " * indent}- **{key}**:'
+
+    @staticmethod
+    def _response_json(result: TestResult) -> str:
+        """
+        获取响应数据的格式化 JSON，首次序列化后缓存在测试结果上
+
+        Args:
+            result: 测试结果
+
+        Returns:
+            缩进为 2 的 JSON 字符串（保留非 ASCII 字符）
+        """
+        if result._response_json is None:
+            if ORJSON_AVAILABLE:
+                result._response_json = orjson.dumps(
+                    result.response_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ).decode('utf-8')
+            else:
+                result._response_json = json.dumps(
+                    result.response_data, ensure_ascii=False, indent=2
+                )
+        return result._response_json
+
+    def save_report(self, content: Union[str, Iterable[str]], filename: str):
+        """
+        保存报告到文件：完整的报告内容原样写入，报告行则逐行流式写入，不在内存中拼接完整报告
+
+        Args:
+            content: 报告内容（generate_markdown_report 的返回值）或报告行（iter_report_lines 的返回值）
             filename: 文件名
 
         Returns:
             保存的文件路径
         """
         filepath = os.path.join(self.output_dir, filename)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        return filepath
\ No newline at end of file
+        # 文件自带 64 KiB 写缓冲，相当于内存中的 StringIO；逐行直接写入，不为每行拼接新字符串
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            if isinstance(content, str):
+                f.write(content)
+            else:
+                write = f.write
+                for line in content:
+                    write(line)
+                    write('\n')
+        return filepath
+
+    def save_report_streaming(
+        self,
+        filename: str,
+        results: List[TestResult],
+        config: TestConfig,
+        additional_info: Dict[str, Any] = None
+    ) -> str:
+        """
+        边生成边写入报告，内存中同一时刻只保留当前一行
+
+        Args:
+            filename: 文件名
+            results: 测试结果列表
+            config: 测试配置
+            additional_info: 额外信息（如 Schema 信息、任务信息等）
+
+        Returns:
+            保存的文件路径
+        """
+        lines = self.iter_report_lines(results, config, additional_info)
+        return self.save_report(lines, filename)
@@ -7,14 +7,17 @@
 
 import os
 import json
+import time
+import asyncio
+import threading
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Coroutine
 from dataclasses import dataclass, field
 
 
 # ==================== 配置模块 ====================
 
-@dataclass
+@dataclass(slots=True)
 class TestConfig:
     """测试配置类"""
     base_api: str
@@ -28,9 +31,14 @@ class TestConfig:
     batch_count: int = 10
     concurrent: int = 1
     timeout: int = 30
+    max_concurrent_downloads: int = 5
+    keep_full_details: bool = False  # 是否在测试结果中保留逐条明细（如每个附件的信息）
     output_dir: str = 'test_reports'
     test_files_dir: str = 'test_files'
     downloads_dir: str = 'downloads'
+    # 测试套件共享的 aiohttp 会话及其所属事件循环（由 TestRunner 创建和关闭）
+    async_session: Optional[Any] = field(default=None, repr=False)
+    event_loop: Optional[asyncio.AbstractEventLoop] = field(default=None, repr=False)
 
     def __post_init__(self):
         """初始化后处理"""
@@ -39,6 +47,25 @@ class TestConfig:
         os.makedirs(self.test_files_dir, exist_ok=True)
         os.makedirs(self.downloads_dir, exist_ok=True)
 
+    def run_async(self, coro: Coroutine) -> Any:
+        """
+        执行协程：存在共享事件循环时在该循环上执行，否则使用 asyncio.run
+
+        共享事件循环正在运行（测试在调度器的工作线程中执行）时，
+        将协程提交到该循环并阻塞等待结果
+
+        Args:
+            coro: 待执行的协程
+
+        Returns:
+            协程的返回值
+        """
+        if self.event_loop is not None:
+            if self.event_loop.is_running():
+                return asyncio.run_coroutine_threadsafe(coro, self.event_loop).result()
+            return self.event_loop.run_until_complete(coro)
+        return asyncio.run(coro)
+
 
 # 预设批量配置
 BATCH_CONFIGS = {
@@ -51,7 +78,7 @@ BATCH_CONFIGS = {
 
 # ==================== 测试结果类 ====================
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """测试结果类"""
     test_name: str
@@ -61,6 +88,10 @@ class TestResult:
     response_data: Optional[Dict] = None
     error: Optional[str] = None
     details: Optional[Dict] = None
+    # response_data 的格式化 JSON 缓存（由报告生成器首次渲染时填充）
+    _response_json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # duration 保留两位小数的文本缓存（同一结果多次渲染报告时复用）
+    _duration_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
 
 # ==================== 测试用例基类 ====================
@@ -88,7 +119,10 @@ class TestCase:
 # ==================== 模拟数据库 ====================
 
 class MockDatabase:
-    """模拟数据库"""
+    """模拟数据库（各集合为内存中的列表，不落盘）"""
+
+    # 各集合默认建立哈希索引的常用查询字段
+    INDEXED_FIELDS = ('id', 'status')
 
     def __init__(self):
         self.collections = {
@@ -96,23 +130,113 @@ class MockDatabase:
             'test_attachments': [],
             'test_errors': []
         }
+        # 哈希索引：集合 -> 字段 -> 字段值 -> 文档在集合中的下标列表（常用字段默认建立）
+        self._indexes: Dict[str, Dict[str, Dict[Any, List[int]]]] = {
+            name: {field_name: {} for field_name in self.INDEXED_FIELDS} for name in self.collections
+        }
+        # 各集合下一个待分配的 ID（单调递增，清空集合后默认不重置，避免 ID 重复）
+        self._next_id: Dict[str, int] = {name: 1 for name in self.collections}
+        # 最近一次格式化的时间戳 (秒, 文本)，同一秒内的插入复用
+        self._timestamp_cache = (None, '')
+        # 测试用例可能在多个线程中并行执行，分配 ID 与追加需要互斥
+        self._lock = threading.Lock()
+
+    def _timestamp(self) -> str:
+        """获取精确到秒的当前时间文本（按秒缓存，调用方需持有锁）"""
+        second = int(time.time())
+        if second != self._timestamp_cache[0]:
+            self._timestamp_cache = (second, datetime.fromtimestamp(second).strftime('%Y-%m-%d %H:%M:%S'))
+        return self._timestamp_cache[1]
+
+    def create_index(self, collection: str, field_name: str):
+        """为集合的指定字段建立哈希索引（已有数据会一并索引）"""
+        if collection not in self.collections:
+            return
+        with self._lock:
+            index: Dict[Any, List[int]] = {}
+            for position, item in enumerate(self.collections[collection]):
+                self._add_to_index(index, field_name, item, position)
+            self._indexes[collection][field_name] = index
+
+    @staticmethod
+    def _add_to_index(index: Dict[Any, List[int]], field_name: str, item: Dict, position: int):
+        """将文档下标登记到单个字段索引中（缺少该字段或值不可哈希时跳过）"""
+        if field_name not in item:
+            return
+        try:
+            index.setdefault(item[field_name], []).append(position)
+        except TypeError:
+            pass
+
+    def _index_rows(self, collection: str, start: int):
+        """将集合中从 start 开始新追加的文档登记到所有索引（调用方需持有锁）"""
+        indexes = self._indexes[collection]
+        if not indexes:
+            return
+        target = self.collections[collection]
+        for field_name, index in indexes.items():
+            for position in range(start, len(target)):
+                self._add_to_index(index, field_name, target[position], position)
 
     def insert(self, collection: str, data: Dict):
         """插入数据"""
         if collection in self.collections:
-            data['id'] = len(self.collections[collection]) + 1
-            data['timestamp'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            self.collections[collection].append(data)
+            with self._lock:
+                target = self.collections[collection]
+                data['id'] = self._next_id[collection]
+                self._next_id[collection] += 1
+                data['timestamp'] = self._timestamp()
+                target.append(data)
+                self._index_rows(collection, len(target) - 1)
+
+    def insert_many(self, collection: str, rows: List[Dict]):
+        """批量插入数据（一次分配 ID 与时间戳并整体追加）"""
+        if collection in self.collections:
+            with self._lock:
+                target = self.collections[collection]
+                start = len(target)
+                next_id = self._next_id[collection]
+                timestamp = self._timestamp()
+                for offset, data in enumerate(rows):
+                    data['id'] = next_id + offset
+                    data['timestamp'] = timestamp
+                self._next_id[collection] = next_id + len(rows)
+                target.extend(rows)
+                self._index_rows(collection, start)
 
     def find(self, collection: str, query: Dict) -> List[Dict]:
-        """查询数据"""
+        """查询数据（查询字段有索引时先按索引取候选文档，其余条件再逐条比较）"""
         if collection not in self.collections:
             return []
 
+        items = self.collections[collection]
+        indexes = self._indexes[collection]
+        candidates = None
+        remaining = query
+        if indexes:
+            remaining = {}
+            for key, value in query.items():
+                index = indexes.get(key)
+                try:
+                    positions = index.get(value) if index is not None else None
+                except TypeError:
+                    index = None
+                if index is None:
+                    remaining[key] = value
+                    continue
+                if not positions:
+                    return []
+                if candidates is None:
+                    candidates = set(positions)
+                else:
+                    candidates.intersection_update(positions)
+            if candidates is not None:
+                items = [items[position] for position in sorted(candidates)]
+
         results = []
-        for item in self.collections[collection]:
+        for item in items:
             match = True
-            for key, value in query.items():
+            for key, value in remaining.items():
                 if key not in item or item[key] != value:
                     match = False
                     break
@@ -124,10 +248,15 @@ class MockDatabase:
         """统计数量"""
         return len(self.collections.get(collection, []))
 
-    def clear(self, collection: str):
-        """清空集合"""
+    def clear(self, collection: str, reset_ids: bool = False):
+        """清空集合（reset_ids 为 True 时 ID 重新从 1 开始分配）"""
         if collection in self.collections:
-            self.collections[collection].clear()
+            with self._lock:
+                self.collections[collection].clear()
+                for index in self._indexes[collection].values():
+                    index.clear()
+                if reset_ids:
+                    self._next_id[collection] = 1
 
     def get_all(self, collection: str) -> List[Dict]:
         """获取所有数据"""